@@ -7,9 +7,32 @@ Run this on match day to add missing fixtures
 import requests
 import sys
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# httpx (with HTTP/2) lets the per-match fallback multiplex all its
+# POSTs over one connection when the server predates the batch endpoint.
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 # Your Railway app URL
 APP_URL = "https://your-app.railway.app"  # CHANGE THIS!
 
+# Shared session so repeated calls reuse one pooled TCP+TLS connection
+# instead of paying the handshake cost per request.  Everything this
+# script sends is a match-creating POST, so only connection-level
+# failures - where the request never reached the app - are retried; a
+# status-based retry after a 5xx could submit the same match twice.
+session = requests.Session()
+session.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
 # Today's Scottish League Two matches (22 Nov 2025)
 MATCHES = [
     {
@@ -55,31 +78,79 @@ MATCHES.extend([
 ])
 
 def add_matches():
-    """Add all matches to the app"""
+    """Add all matches to the app in a single batch request"""
     if "your-app" in APP_URL:
         print("ERROR: Please edit this script and set your Railway app URL!")
         print(f"Change APP_URL = '{APP_URL}' to your actual Railway URL")
         sys.exit(1)
-    
+
     print(f"Adding {len(MATCHES)} matches to {APP_URL}...")
-    
-    for match in MATCHES:
-        try:
-            resp = requests.post(
-                f"{APP_URL}/api/manual_matches",
-                json=match,
-                timeout=10
-            )
-            
-            if resp.status_code == 200:
-                print(f"✅ Added: {match['homeTeam']} vs {match['awayTeam']}")
-            else:
-                print(f"❌ Failed: {match['homeTeam']} vs {match['awayTeam']} - {resp.status_code}")
-                print(f"   Response: {resp.text}")
-        except Exception as e:
-            print(f"❌ Error adding {match['homeTeam']} vs {match['awayTeam']}: {e}")
-    
+
+    try:
+        resp = session.post(
+            f"{APP_URL}/api/manual_matches/batch",
+            json={"matches": MATCHES},
+            timeout=30
+        )
+    except Exception as e:
+        print(f"❌ Error sending batch request: {e}")
+        sys.exit(1)
+
+    if resp.status_code == 404:
+        # Older deployment without the batch endpoint - post individually
+        print("Batch endpoint not available, adding matches one by one...")
+        add_matches_individually()
+        return
+
+    if resp.status_code != 200:
+        print(f"❌ Batch request failed - {resp.status_code}")
+        print(f"   Response: {resp.text}")
+        sys.exit(1)
+
+    results = resp.json().get("results", [])
+    for match, result in zip(MATCHES, results):
+        if result.get("success"):
+            print(f"✅ Added: {match['homeTeam']} vs {match['awayTeam']}")
+        else:
+            print(f"❌ Failed: {match['homeTeam']} vs {match['awayTeam']} - {result.get('message')}")
+
     print("\nDone! Refresh your admin page to see the matches.")
 
+
+def add_matches_individually():
+    """Fallback: add matches one at a time via the single-match endpoint.
+
+    When httpx is installed, POSTs are multiplexed over one HTTP/2
+    connection so N matches cost roughly one round trip; otherwise the
+    pooled requests session is used.
+    """
+    url = f"{APP_URL}/api/manual_matches"
+
+    def report(match, status_code, text):
+        if status_code == 200:
+            print(f"✅ Added: {match['homeTeam']} vs {match['awayTeam']}")
+        else:
+            print(f"❌ Failed: {match['homeTeam']} vs {match['awayTeam']} - {status_code}")
+            print(f"   Response: {text}")
+
+    if HTTPX_AVAILABLE:
+        with httpx.Client(http2=True, timeout=10) as client:
+            for match in MATCHES:
+                try:
+                    resp = client.post(url, json=match)
+                    report(match, resp.status_code, resp.text)
+                except Exception as e:
+                    print(f"❌ Error adding {match['homeTeam']} vs {match['awayTeam']}: {e}")
+    else:
+        for match in MATCHES:
+            try:
+                resp = session.post(url, json=match, timeout=10)
+                report(match, resp.status_code, resp.text)
+            except Exception as e:
+                print(f"❌ Error adding {match['homeTeam']} vs {match['awayTeam']}: {e}")
+
+    print("\nDone! Refresh your admin page to see the matches.")
+
+
 if __name__ == "__main__":
     add_matches()
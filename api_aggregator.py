@@ -2,8 +2,16 @@
 Multi-API Aggregator for Football Match Data
 Combines data from ESPN, TheSportsDB, Football-Data.org, and BBC Sport
 """
-import requests
-from typing import List, Dict, Optional
+import asyncio
+import itertools
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+
+import aiohttp
+from typing import Iterable, List, Dict, Optional
 import datetime
 import os
 
@@ -16,6 +24,32 @@ except ImportError:
     BBC_AVAILABLE = False
     print("BBC scraper not available")
 
+# orjson decodes the large scoreboard payloads 2-4x faster than the
+# stdlib json module; fall back silently when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# rapidfuzz catches near-duplicate team names across providers
+# ("Inverness CT" vs "Inverness Caledonian Thistle"); without it dedup
+# falls back to exact normalized-name matching.
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Minimum token_set_ratio score for two fixtures to count as the same match
+FUZZY_MATCH_CUTOFF = 92
+
+
+async def _read_json(resp: "aiohttp.ClientResponse"):
+    """Decode a response body as JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(await resp.read())
+    return await resp.json(content_type=None)
+
 
 # API Configuration
 FOOTBALL_DATA_API_KEY = os.environ.get("FOOTBALL_DATA_API_KEY", "")
@@ -35,227 +69,487 @@ LEAGUE_MAPPINGS = {
     "eng.4": ("EL2", "4397", "42"),  # League Two
 }
 
+# Per-provider league ID lookups, specialised once at import time so the
+# fetchers do a single .get() instead of a membership check plus tuple
+# unpack on every call.
+ESPN_TO_FD = {espn: ids[0] for espn, ids in LEAGUE_MAPPINGS.items()}
+ESPN_TO_SDB = {espn: ids[1] for espn, ids in LEAGUE_MAPPINGS.items()}
+ESPN_TO_APIFOOTBALL = {espn: ids[2] for espn, ids in LEAGUE_MAPPINGS.items()}
+
+
+# TTL cache for aggregated (league, date) match lists.  Live or upcoming
+# fixture lists go stale quickly so they expire after a couple of minutes;
+# lists where every match has finished can never change again and are
+# kept for a day.  Entries map (league_code, date_str) -> (expiry, matches).
+MATCH_CACHE_TTL = 120
+MATCH_CACHE_TTL_FINISHED = 24 * 3600
+MATCH_CACHE_MAX_ENTRIES = 256
+_match_cache: Dict[tuple, tuple] = {}
+
+
+# Conditional-GET cache: url key -> (etag, last_modified, parsed_matches).
+# When a provider answers 304 Not Modified the previously parsed list is
+# reused, skipping both the body download and the JSON decode.  The URLs
+# embed the requested date, so the cache is capped and cleared outright
+# when full; entries carry no expiry to prune by.
+CONDITIONAL_CACHE_MAX_ENTRIES = 256
+_conditional_cache: Dict[str, tuple] = {}
+
+
+def _conditional_headers(cache_key: str) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers for a cached URL."""
+    headers: Dict[str, str] = {}
+    cached = _conditional_cache.get(cache_key)
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _store_conditional(cache_key: str, resp_headers, matches: "List[Match]") -> None:
+    """Remember validators and the parsed result for the next poll."""
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if etag or last_modified:
+        if cache_key not in _conditional_cache and \
+                len(_conditional_cache) >= CONDITIONAL_CACHE_MAX_ENTRIES:
+            _conditional_cache.clear()
+        _conditional_cache[cache_key] = (etag, last_modified, matches)
+
+
+def _is_terminal_status(status: str) -> bool:
+    """Return True if a match status string describes a finished match."""
+    s = (status or "").strip().lower()
+    return s in ("ft", "full time", "aet") or "finished" in s or s.startswith("ft")
+
+
+def _prune_match_cache() -> None:
+    """Drop expired entries once the cache grows beyond its size cap."""
+    if len(_match_cache) <= MATCH_CACHE_MAX_ENTRIES:
+        return
+    now = time.time()
+    for key in [k for k, (expiry, _) in _match_cache.items() if expiry <= now]:
+        del _match_cache[key]
+
+
+@dataclass(slots=True)
+class Match:
+    """One fixture from a single provider, before deduplication.
+
+    Slotted instances are roughly 3x smaller than the equivalent dicts
+    and attribute access avoids per-key hashing, which matters once
+    backfills aggregate thousands of fixtures.
+    """
+    eventId: str
+    source: str
+    league: str
+    homeTeam: str
+    awayTeam: str
+    status: str
+    date: str
+
+    def to_dict(self) -> Dict:
+        """Plain-dict form for JSON serialization at the HTTP boundary."""
+        return {
+            "eventId": self.eventId,
+            "source": self.source,
+            "league": self.league,
+            "homeTeam": self.homeTeam,
+            "awayTeam": self.awayTeam,
+            "status": self.status,
+            "date": self.date,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> "Match":
+        """Build a Match from a provider dict (e.g. the BBC scraper)."""
+        return cls(
+            eventId=str(d.get("eventId", "")),
+            source=d.get("source", "Unknown"),
+            league=d.get("league", ""),
+            homeTeam=d.get("homeTeam", ""),
+            awayTeam=d.get("awayTeam", ""),
+            status=d.get("status", ""),
+            date=d.get("date", ""),
+        )
+
 
+# Strips any run of common suffixes from the end of a name in one
+# C-level scan ("Newcastle United FC" -> "Newcastle").
+_SUFFIX_RE = re.compile(r"(?:\s+(?:fc|afc|united|city|town))+\s*$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def normalize_team_name(name: str) -> str:
-    """Normalize team names for deduplication (lowercase, remove FC/AFC)"""
-    name = name.lower().strip()
-    # Remove common suffixes
-    for suffix in [" fc", " afc", " united", " city", " town"]:
-        if name.endswith(suffix):
-            name = name[:-len(suffix)].strip()
-    return name
+    """Normalize team names for deduplication (lowercase, remove FC/AFC)
 
+    Team names repeat heavily across dates, providers and dedup passes,
+    so the result is memoized; the function is pure, which also makes
+    the cache thread-safe.
+    """
+    return _SUFFIX_RE.sub("", name.strip()).lower()
+
+
+def _iso_date(date_str: str) -> str:
+    """Convert an ESPN-style YYYYMMDD date to dashed YYYY-MM-DD form."""
+    return datetime.datetime.strptime(date_str, "%Y%m%d").date().isoformat()
+
+
+def _espn_request(league_id: str, date_str: str, iso_date: str) -> tuple:
+    url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{league_id}/scoreboard"
+    return url, {"dates": date_str}, {}, f"{url}?dates={date_str}"
+
+
+def _parse_espn_event(event: Dict) -> Optional[tuple]:
+    competitions = event.get("competitions", [])
+    if not competitions:
+        return None
+    competitors = competitions[0].get("competitors", [])
+    if len(competitors) != 2:
+        return None
+    home_comp = next((c for c in competitors if c.get("homeAway") == "home"), competitors[0])
+    away_comp = next((c for c in competitors if c.get("homeAway") == "away"), competitors[1])
+    return (
+        f"espn_{event.get('id')}",
+        home_comp.get("team", {}).get("displayName", ""),
+        away_comp.get("team", {}).get("displayName", ""),
+        event.get("status", {}).get("type", {}).get("detail", "Scheduled"),
+    )
+
+
+def _thesportsdb_request(league_id: str, date_str: str, iso_date: str) -> tuple:
+    # TheSportsDB free API for events by date (limited)
+    url = f"https://www.thesportsdb.com/api/v1/json/3/eventsday.php?d={iso_date}&l={league_id}"
+    return url, None, {}, url
+
+
+def _parse_thesportsdb_event(event: Dict) -> Optional[tuple]:
+    return (
+        f"thesportsdb_{event.get('idEvent')}",
+        event.get("strHomeTeam", ""),
+        event.get("strAwayTeam", ""),
+        event.get("strStatus", ""),
+    )
+
+
+def _footballdata_request(league_id: str, date_str: str, iso_date: str) -> tuple:
+    url = f"https://api.football-data.org/v4/competitions/{league_id}/matches"
+    params = {"dateFrom": iso_date, "dateTo": iso_date}
+    headers = {"X-Auth-Token": FOOTBALL_DATA_API_KEY}
+    return url, params, headers, f"{url}?dateFrom={iso_date}&dateTo={iso_date}"
+
+
+def _parse_footballdata_event(match: Dict) -> Optional[tuple]:
+    return (
+        f"footballdata_{match.get('id')}",
+        match.get("homeTeam", {}).get("name", ""),
+        match.get("awayTeam", {}).get("name", ""),
+        match.get("status", "SCHEDULED"),
+    )
+
+
+# One config entry per provider drives the shared fetcher below:
+#   source      - value stored on each Match
+#   league_id   - maps an ESPN league code to the provider's ID (None = skip)
+#   request     - builds (url, params, headers, conditional-GET cache key)
+#   events_key  - key holding the event list in the response payload
+#   parse_event - maps one raw event to (eventId, home, away, status)
+#   require_200 - whether a non-200 response should be treated as empty
+#                 (ESPN returns useful JSON bodies on 400)
+ESPN_PROVIDER = {
+    "source": "ESPN",
+    "league_id": lambda league_code: league_code,
+    "request": _espn_request,
+    "events_key": "events",
+    "parse_event": _parse_espn_event,
+    "require_200": False,
+}
+
+THESPORTSDB_PROVIDER = {
+    "source": "TheSportsDB",
+    "league_id": ESPN_TO_SDB.get,
+    "request": _thesportsdb_request,
+    "events_key": "events",
+    "parse_event": _parse_thesportsdb_event,
+    "require_200": False,
+}
+
+FOOTBALLDATA_PROVIDER = {
+    "source": "Football-Data",
+    "league_id": ESPN_TO_FD.get,
+    "request": _footballdata_request,
+    "events_key": "matches",
+    "parse_event": _parse_footballdata_event,
+    "require_200": True,
+}
+
+# Providers polled by fetch_all_matches.  Football-Data is left out
+# entirely when no API key is configured, so keyless deployments never
+# pay for the call.
+PROVIDERS = [ESPN_PROVIDER, THESPORTSDB_PROVIDER]
+if FOOTBALL_DATA_API_KEY:
+    PROVIDERS.append(FOOTBALLDATA_PROVIDER)
+
+
+async def fetch_generic(session: aiohttp.ClientSession, provider: Dict,
+                        league_code: str, date_str: str,
+                        iso_date: Optional[str] = None) -> List[Match]:
+    """Fetch and parse matches from one provider described by its config.
+
+    All three providers share the same skeleton (build URL, GET JSON,
+    walk an event list, map fields), so the differences live in the
+    provider config tables above and this is the only fetch loop.
+    """
+    matches: List[Match] = []
+
+    league_id = provider["league_id"](league_code)
+    if league_id is None:
+        return matches
+
+    if iso_date is None:
+        # Dashed YYYY-MM-DD form for providers that want it; callers
+        # fetching several providers pass this in precomputed
+        iso_date = _iso_date(date_str)
+    url, params, headers, cache_key = provider["request"](league_id, date_str, iso_date)
+    headers = {**headers, **_conditional_headers(cache_key)}
 
-def fetch_from_espn(league_code: str, date_str: str) -> List[Dict]:
-    """Fetch matches from ESPN API"""
-    matches = []
-    url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{league_code}/scoreboard"
-    params = {"dates": date_str}
-    
     try:
-        resp = requests.get(url, params=params, timeout=10)
-        data = resp.json()
-        
-        if not isinstance(data, dict) or "events" not in data:
+        async with session.get(url, params=params, headers=headers,
+                               timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            if resp.status == 304:
+                return _conditional_cache[cache_key][2]
+            if provider["require_200"] and resp.status != 200:
+                return matches
+            resp_headers = resp.headers
+            data = await _read_json(resp)
+
+        if not isinstance(data, dict):
             return matches
-            
-        for event in data.get("events", []):
-            event_id = str(event.get("id"))
-            competitions = event.get("competitions", [])
-            if not competitions:
+        events = data.get(provider["events_key"])
+        if not isinstance(events, list):
+            return matches
+
+        parse_event = provider["parse_event"]
+        source = provider["source"]
+        for event in events:
+            if not event:  # Skip null events
                 continue
-                
-            comp = competitions[0]
-            competitors = comp.get("competitors", [])
-            if len(competitors) != 2:
+            parsed = parse_event(event)
+            if parsed is None:
                 continue
-                
-            home_comp = next((c for c in competitors if c.get("homeAway") == "home"), competitors[0])
-            away_comp = next((c for c in competitors if c.get("homeAway") == "away"), competitors[1])
-            
-            home_team = home_comp.get("team", {}).get("displayName", "")
-            away_team = away_comp.get("team", {}).get("displayName", "")
-            status = event.get("status", {}).get("type", {}).get("detail", "Scheduled")
-            
-            matches.append({
-                "eventId": f"espn_{event_id}",
-                "source": "ESPN",
-                "league": league_code,
-                "homeTeam": home_team,
-                "awayTeam": away_team,
-                "homeTeamNorm": normalize_team_name(home_team),
-                "awayTeamNorm": normalize_team_name(away_team),
-                "status": status,
-                "date": date_str
-            })
+            event_id, home_team, away_team, status = parsed
+            matches.append(Match(
+                eventId=event_id,
+                source=source,
+                league=league_code,
+                homeTeam=home_team,
+                awayTeam=away_team,
+                status=status,
+                date=date_str,
+            ))
+        _store_conditional(cache_key, resp_headers, matches)
     except Exception as e:
-        print(f"ESPN API error for {league_code}: {e}")
-        
+        print(f"{provider['source']} API error for {league_code}: {e}")
+
     return matches
 
 
-def fetch_from_thesportsdb(league_code: str, date_str: str) -> List[Dict]:
+async def fetch_from_espn(session: aiohttp.ClientSession, league_code: str, date_str: str) -> List[Match]:
+    """Fetch matches from ESPN API"""
+    return await fetch_generic(session, ESPN_PROVIDER, league_code, date_str)
+
+
+async def fetch_from_thesportsdb(session: aiohttp.ClientSession, league_code: str, date_str: str) -> List[Match]:
     """Fetch matches from TheSportsDB API (free tier)"""
-    matches = []
-    
-    # Get TheSportsDB league ID from mapping
-    if league_code not in LEAGUE_MAPPINGS:
-        return matches
-    
-    _, thesportsdb_id, _ = LEAGUE_MAPPINGS[league_code]
-    
-    # TheSportsDB free API for events by date (limited)
-    # Format date as YYYY-MM-DD
-    formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
-    
-    try:
-        # Using the event search endpoint
-        url = f"https://www.thesportsdb.com/api/v1/json/3/eventsday.php?d={formatted_date}&l={thesportsdb_id}"
-        resp = requests.get(url, timeout=10)
-        data = resp.json()
-        
-        if data and "events" in data and data["events"]:
-            for event in data["events"]:
-                if not event:  # Skip null events
-                    continue
-                    
-                home_team = event.get("strHomeTeam", "")
-                away_team = event.get("strAwayTeam", "")
-                status = event.get("strStatus", "")
-                
-                matches.append({
-                    "eventId": f"thesportsdb_{event.get('idEvent')}",
-                    "source": "TheSportsDB",
-                    "league": league_code,
-                    "homeTeam": home_team,
-                    "awayTeam": away_team,
-                    "homeTeamNorm": normalize_team_name(home_team),
-                    "awayTeamNorm": normalize_team_name(away_team),
-                    "status": status,
-                    "date": date_str
-                })
-    except Exception as e:
-        print(f"TheSportsDB API error for {league_code}: {e}")
-        
-    return matches
+    return await fetch_generic(session, THESPORTSDB_PROVIDER, league_code, date_str)
 
 
-def fetch_from_footballdata(league_code: str, date_str: str) -> List[Dict]:
+async def fetch_from_footballdata(session: aiohttp.ClientSession, league_code: str, date_str: str) -> List[Match]:
     """Fetch matches from Football-Data.org API"""
-    matches = []
-    
     if not FOOTBALL_DATA_API_KEY:
-        return matches  # Skip if no API key
-        
-    # Get Football-Data code from mapping
-    if league_code not in LEAGUE_MAPPINGS:
-        return matches
-    
-    fd_code, _, _ = LEAGUE_MAPPINGS[league_code]
-    
-    # Format date as YYYY-MM-DD
-    formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
-    
-    try:
-        url = f"https://api.football-data.org/v4/competitions/{fd_code}/matches"
-        headers = {"X-Auth-Token": FOOTBALL_DATA_API_KEY}
-        params = {"dateFrom": formatted_date, "dateTo": formatted_date}
-        
-        resp = requests.get(url, headers=headers, params=params, timeout=10)
-        
-        if resp.status_code != 200:
-            return matches
-            
-        data = resp.json()
-        
-        if "matches" in data:
-            for match in data["matches"]:
-                home_team = match.get("homeTeam", {}).get("name", "")
-                away_team = match.get("awayTeam", {}).get("name", "")
-                status = match.get("status", "SCHEDULED")
-                
-                matches.append({
-                    "eventId": f"footballdata_{match.get('id')}",
-                    "source": "Football-Data",
-                    "league": league_code,
-                    "homeTeam": home_team,
-                    "awayTeam": away_team,
-                    "homeTeamNorm": normalize_team_name(home_team),
-                    "awayTeamNorm": normalize_team_name(away_team),
-                    "status": status,
-                    "date": date_str
-                })
-    except Exception as e:
-        print(f"Football-Data API error for {league_code}: {e}")
-        
-    return matches
+        return []  # Skip if no API key
+    return await fetch_generic(session, FOOTBALLDATA_PROVIDER, league_code, date_str)
 
 
-def deduplicate_matches(matches: List[Dict]) -> List[Dict]:
+def _find_fuzzy_duplicate(home_norm: str, away_norm: str, accepted: List[tuple]) -> Optional[tuple]:
+    """Find the dedup key of an already accepted fixture this one matches.
+
+    Compares "home away" strings with token_set_ratio so abbreviations
+    and word-order differences ("Inverness CT" vs "Inverness Caledonian
+    Thistle") still merge.  Returns the accepted fixture's key, or None
+    when there is no fuzzy match or rapidfuzz is unavailable.
+    """
+    if not RAPIDFUZZ_AVAILABLE or not accepted:
+        return None
+    candidate = f"{home_norm} {away_norm}"
+    for prev_home, prev_away, prev_key in accepted:
+        if fuzz.token_set_ratio(candidate, f"{prev_home} {prev_away}") >= FUZZY_MATCH_CUTOFF:
+            return prev_key
+    return None
+
+
+def deduplicate_matches(matches: Iterable[Match]) -> List[Match]:
     """
-    Remove duplicate matches based on normalized team names and date.
+    Remove duplicate matches from any iterable of Match records, based
+    on normalized team names and date.
     Prioritize sources in order: ESPN > Football-Data > TheSportsDB
+
+    Exact duplicates are dropped on the normalized-name key; when
+    rapidfuzz is installed, near-duplicates from providers that spell
+    the same team differently are also merged within each
+    (league, date) group.
     """
-    seen = {}
-    unique_matches = []
-    
-    # Sort by source priority
+    # Insertion-ordered dict doubles as both the dedup index and the
+    # output, so there's no parallel list to keep in sync.
+    seen: Dict[tuple, Match] = {}
+
+    # Accepted (home, away, key) triples bucketed by a blocking key of
+    # (league, date, first 3 chars of home name).  Fuzzy comparison only
+    # runs within a bucket, so batch backfills cost O(N * bucket size)
+    # instead of O(N^2) with the same practical recall.
+    accepted_pairs: Dict[tuple, List[tuple]] = defaultdict(list)
+
     source_priority = {"ESPN": 0, "Football-Data": 1, "TheSportsDB": 2}
-    matches_sorted = sorted(matches, key=lambda x: source_priority.get(x["source"], 99))
-    
-    for match in matches_sorted:
-        # Create unique key from normalized team names and date
-        key = f"{match['homeTeamNorm']}_{match['awayTeamNorm']}_{match['date']}"
-        
-        if key not in seen:
+
+    # Single pass, no pre-sort: on a duplicate key the higher-priority
+    # source wins the upsert, which is equivalent to sorting first but
+    # lets the function stream matches from any iterable.
+    for match in matches:
+        priority = source_priority.get(match.source, 99)
+        # Normalize lazily: matches dropped here never pay for it twice,
+        # and the lru_cache makes repeats nearly free
+        home_norm = normalize_team_name(match.homeTeam)
+        away_norm = normalize_team_name(match.awayTeam)
+        # Tuple keys hash without allocating a formatted string per match
+        key = (home_norm, away_norm, match.date)
+
+        current = seen.get(key)
+        if current is None:
+            group = accepted_pairs[(match.league, match.date, home_norm[:3])]
+            fuzzy_key = _find_fuzzy_duplicate(home_norm, away_norm, group)
+            if fuzzy_key is None:
+                seen[key] = match
+                group.append((home_norm, away_norm, key))
+                continue
+            key = fuzzy_key
+            current = seen[key]
+        if priority < source_priority.get(current.source, 99):
             seen[key] = match
-            unique_matches.append(match)
-    
-    return unique_matches
+
+    return list(seen.values())
 
 
-def fetch_all_matches(league_code: str, date_str: str) -> List[Dict]:
+async def fetch_all_matches(league_code: str, date_str: str,
+                            session: Optional[aiohttp.ClientSession] = None,
+                            force_refresh: bool = False) -> List[Match]:
     """
     Aggregate matches from all available APIs for a given league and date.
     Returns deduplicated list of matches.
+
+    The three providers are queried concurrently so total latency is
+    roughly one round trip instead of three.  A shared session can be
+    passed in to reuse pooled connections across calls; otherwise a
+    temporary one is created for this call.
+
+    Results are cached per (league_code, date_str) so repeated admin
+    page refreshes cost a dict lookup instead of three round trips.
+    Pass force_refresh=True to bypass the cache.
     """
-    all_matches = []
-    
-    # Fetch from all sources
-    all_matches.extend(fetch_from_espn(league_code, date_str))
-    all_matches.extend(fetch_from_thesportsdb(league_code, date_str))
-    all_matches.extend(fetch_from_footballdata(league_code, date_str))
-    
+    cache_key = (league_code, date_str)
+    if not force_refresh:
+        cached = _match_cache.get(cache_key)
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+
+    if session is None:
+        async with aiohttp.ClientSession() as owned_session:
+            return await fetch_all_matches(league_code, date_str, owned_session,
+                                           force_refresh=force_refresh)
+
+    # Fetch from all configured providers concurrently.  The dashed date
+    # is computed once here rather than per provider.
+    iso_date = _iso_date(date_str)
+    results = await asyncio.gather(
+        *(fetch_generic(session, provider, league_code, date_str, iso_date) for provider in PROVIDERS)
+    )
+    per_source: List = list(results)
+
     # Add BBC Sport scraping for Scottish leagues (best source for these)
     if BBC_AVAILABLE and league_code.startswith("sco"):
         try:
-            bbc_matches = scrape_bbc_matches(league_code, date_str)
-            all_matches.extend(bbc_matches)
+            bbc_matches = await asyncio.to_thread(scrape_bbc_matches, league_code, date_str)
+            per_source.append(Match.from_dict(m) for m in bbc_matches)
             print(f"BBC scraper added {len(bbc_matches)} matches for {league_code}")
         except Exception as e:
             print(f"BBC scraper failed for {league_code}: {e}")
-    
-    # Deduplicate
-    unique_matches = deduplicate_matches(all_matches)
-    
+
+    # Deduplicate, streaming the per-source lists through a single chain
+    # rather than copying them into one flat list first
+    unique_matches = deduplicate_matches(itertools.chain.from_iterable(per_source))
+
+    # Finished lists never change, so they get the long TTL
+    if unique_matches and all(_is_terminal_status(m.status) for m in unique_matches):
+        ttl = MATCH_CACHE_TTL_FINISHED
+    else:
+        ttl = MATCH_CACHE_TTL
+    _match_cache[cache_key] = (time.time() + ttl, unique_matches)
+    _prune_match_cache()
+
     return unique_matches
 
 
-def convert_to_app_format(matches: List[Dict]) -> List[Dict]:
+def fetch_all_matches_sync(league_code: str, date_str: str) -> List[Match]:
+    """Synchronous wrapper around :func:`fetch_all_matches` for Flask callers."""
+    return asyncio.run(fetch_all_matches(league_code, date_str))
+
+
+async def fetch_all_leagues(leagues: List[str], date_str: str) -> List[Match]:
+    """
+    Fetch matches for every league concurrently and return one
+    deduplicated list.
+
+    All leagues share a single session so connections are pooled; the
+    connector limit and semaphore cap in-flight requests so no single
+    provider gets hammered when many leagues are configured.
+    """
+    semaphore = asyncio.Semaphore(8)
+
+    async def fetch_league(league_code: str) -> List[Match]:
+        async with semaphore:
+            return await fetch_all_matches(league_code, date_str, session)
+
+    connector = aiohttp.TCPConnector(limit_per_host=8)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        per_league = await asyncio.gather(*(fetch_league(lc) for lc in leagues))
+
+    # Deduplicate once across leagues (cup ties can appear twice) without
+    # materialising an intermediate flattened list
+    return deduplicate_matches(itertools.chain.from_iterable(per_league))
+
+
+def fetch_all_leagues_sync(leagues: List[str], date_str: str) -> List[Match]:
+    """Synchronous wrapper around :func:`fetch_all_leagues` for Flask callers."""
+    return asyncio.run(fetch_all_leagues(leagues, date_str))
+
+
+def convert_to_app_format(matches: List[Match]) -> List[Dict]:
     """
-    Convert aggregated match format to the app's expected format.
+    Convert aggregated Match records to the app's expected dict format.
     """
     converted = []
-    
+
     for match in matches:
         converted.append({
-            "eventId": match["eventId"],
-            "league": match["league"],
-            "homeTeam": match["homeTeam"],
-            "awayTeam": match["awayTeam"],
-            "title": f"{match['homeTeam']} vs {match['awayTeam']}",
-            "status": match["status"],
-            "source": match.get("source", "Unknown")  # Keep track of source
+            "eventId": match.eventId,
+            "league": match.league,
+            "homeTeam": match.homeTeam,
+            "awayTeam": match.awayTeam,
+            "title": f"{match.homeTeam} vs {match.awayTeam}",
+            "status": match.status,
+            "source": match.source or "Unknown"  # Keep track of source
         })
-    
+
     return converted
@@ -1,9 +1,26 @@
+import asyncio
 import datetime
+import heapq
 import json
 import os
+import queue
+import re
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+# fcntl backs the cross-process notifier lock; unavailable on Windows,
+# where single-process app.run is the only supported mode anyway.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 import pytz
-from flask import Flask, jsonify, render_template, request, session, redirect
+from flask import Flask, jsonify, render_template, request, session, redirect, stream_with_context
 # Application version string.  Incremented when new features are added.
 APP_VERSION = "v2.4.3-minimal-debug"
 import requests
@@ -12,6 +29,83 @@ from typing import Dict, List, Optional
 
 app = Flask(__name__, static_folder="static", template_folder="templates")
 
+# Keep any remaining jsonify callers lean: no key sorting, no pretty-
+# printing.  Set on the json provider; the old JSON_SORT_KEYS /
+# JSONIFY_PRETTYPRINT_REGULAR config keys were dropped in Flask 2.3.
+app.json.sort_keys = False
+app.json.compact = True
+
+# orjson serializes the large match-list responses 3-10x faster than the
+# stdlib json encoder; fall back to jsonify when it isn't installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# aiohttp multiplexes the day x league scoreboard grid in update_results
+# over a few pooled connections; the threaded fetch is the fallback.
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# ciso8601 parses ESPN's ISO timestamps in C and handles the trailing
+# "Z" directly; fromisoformat after a string replace is the fallback.
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+
+def _parse_iso_utc(iso_str: str) -> datetime.datetime:
+    """Parse an ISO 8601 UTC timestamp such as "2025-08-08T19:00Z"."""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(iso_str)
+    return datetime.datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
+
+
+# NumPy vectorizes the BTTS aggregation once the results history grows to
+# thousands of matches; the pure-Python path remains the fallback.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _json_response(obj):
+    """Build a JSON response with orjson when available."""
+    if orjson is None:
+        return jsonify(obj)
+    return app.response_class(orjson.dumps(obj), mimetype="application/json")
+
+
+def _stream_json_list(items):
+    """Serialize a list as a streamed JSON array response.
+
+    Busy match days produce large payloads; yielding one serialized item
+    at a time lets Flask start flushing bytes to slow clients while the
+    tail is still being encoded, instead of building the whole body in
+    memory first.
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        dumps = lambda obj: json.dumps(obj).encode("utf-8")
+
+    def gen():
+        yield b"["
+        first = True
+        for item in items:
+            if not first:
+                yield b","
+            first = False
+            yield dumps(item)
+        yield b"]"
+
+    return app.response_class(stream_with_context(gen()), mimetype="application/json")
+
 # Secret key for session management (e.g. admin login).  In a production
 # deployment, this should be set via an environment variable and kept
 # secret.  A default is provided here for convenience.
@@ -34,6 +128,15 @@ ODDS_PASSWORD = os.environ.get("ODDS_PASSWORD", "odds123")
 # date, league, homeTeam, awayTeam, homeScore, awayScore and eventId.
 RESULTS_FILE = os.path.join(os.path.dirname(__file__), "results.json")
 
+# The app works exclusively in UK time; building the tzinfo once avoids
+# a pytz cache walk on every call site.
+_TZ_LONDON = pytz.timezone("Europe/London")
+
+# Weekday names for kickoff labels; f-string integer formatting on these
+# skips a locale-aware strftime call per request.
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday",
+             "Saturday", "Sunday")
+
 # Names of the participants used throughout the application.  The order
 # determines how assignments are stored and displayed on the front-end.
 FRIEND_NAMES: List[str] = [
@@ -110,6 +213,113 @@ LEAGUE_CODES: List[str] = [
 # Settings Loading and Saving
 # -----------------------------
 
+# Parsed-JSON cache keyed by file path and invalidated by mtime.  The
+# settings/groups/assignments files are read on almost every request but
+# change rarely, so an unchanged file costs one stat instead of a parse.
+_json_file_cache: Dict[str, tuple] = {}
+
+
+def _load_json_file(path: str):
+    """Load a JSON file, reusing the parse while its mtime is unchanged.
+
+    Returns the parsed object, or None when the file is missing or
+    invalid; callers apply their own defaults.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    cached = _json_file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return None
+    _json_file_cache[path] = (mtime, data)
+    return data
+
+
+def _store_json_cache(path: str, data) -> None:
+    """Write-through cache update after a successful save."""
+    try:
+        _json_file_cache[path] = (os.stat(path).st_mtime_ns, data)
+    except OSError:
+        pass
+
+
+def _write_json_file(path: str, obj, pretty: bool = False) -> None:
+    """Serialize obj and atomically replace path via a .tmp sibling.
+
+    The rename means readers never observe a partially written file,
+    even if the process dies mid-write.
+    """
+    tmp = path + ".tmp"
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    else:
+        payload = json.dumps(obj, indent=2 if pretty else None).encode("utf-8")
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+    _store_json_cache(path, obj)
+
+
+# Write-behind persistence for the small, frequently rewritten config
+# files.  Saves enqueue (path, obj) and return immediately; a daemon
+# thread debounces per path and flushes at most every couple of seconds,
+# keeping fsync stalls off the notifier and request threads.  The parsed
+# cache is updated at enqueue time so in-process readers see the new
+# object straight away.
+PERSIST_DEBOUNCE_SECONDS = 2.0
+_PERSIST_QUEUE: "queue.Queue[tuple]" = queue.Queue()
+_persist_thread_lock = threading.Lock()
+_persist_thread_started = False
+
+
+def _persist_worker() -> None:
+    while True:
+        path, obj, pretty = _PERSIST_QUEUE.get()
+        pending = {path: (obj, pretty)}
+        deadline = time.time() + PERSIST_DEBOUNCE_SECONDS
+        # Coalesce anything else written within the debounce window,
+        # keeping only the newest object per path
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            try:
+                path, obj, pretty = _PERSIST_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+            pending[path] = (obj, pretty)
+        for path, (obj, pretty) in pending.items():
+            try:
+                _write_json_file(path, obj, pretty)
+            except Exception:
+                pass
+
+
+def _enqueue_json_write(path: str, obj, pretty: bool = False) -> None:
+    """Queue a JSON write for the background flusher."""
+    global _persist_thread_started
+    if not _persist_thread_started:
+        with _persist_thread_lock:
+            if not _persist_thread_started:
+                threading.Thread(target=_persist_worker, daemon=True).start()
+                _persist_thread_started = True
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = -1
+    # Readers consult the parsed cache first; the on-disk mtime is
+    # unchanged until the flush, so this makes the write visible now
+    _json_file_cache[path] = (mtime, obj)
+    _PERSIST_QUEUE.put((path, obj, pretty))
+
+
 def load_settings() -> Dict[str, str]:
     """Load global settings from disk.
 
@@ -136,12 +346,8 @@ def load_settings() -> Dict[str, str]:
         "telegram_chat_id": DEFAULT_TELEGRAM.get("telegram_chat_id", ""),
         "poll_seconds": DEFAULT_TELEGRAM.get("poll_seconds", 30),
     }
-    try:
-        with open(SETTINGS_FILE, "r") as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
-            data = {}
-    except Exception:
+    data = _load_json_file(SETTINGS_FILE)
+    if not isinstance(data, dict):
         data = {}
     merged = defaults.copy()
     for key, value in data.items():
@@ -160,26 +366,52 @@ def load_results() -> List[dict]:
     Returns a list of dictionaries, each representing a finished match.
     The file is created on demand if it does not exist or is invalid.
     """
-    try:
-        with open(RESULTS_FILE, "r") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return data
-    except Exception:
-        pass
+    data = _load_json_file(RESULTS_FILE)
+    if isinstance(data, list):
+        return data
     return []
 
 
 def save_results(results: List[dict]) -> None:
     """Persist the list of match results to disk."""
     try:
-        with open(RESULTS_FILE, "w") as f:
-            json.dump(results, f)
+        _write_json_file(RESULTS_FILE, results)
     except Exception:
         # Log failures silently; the caller can handle errors
         pass
 
 
+# Cached eventId set for the results list, keyed by list identity.  The
+# mtime cache hands back the same list object while the file is
+# unchanged, so the set is rebuilt only when the history is re-read.
+_results_ids_cache: tuple = (None, None)
+
+
+def _results_with_ids() -> tuple:
+    """Return (results, existing_ids) with the id set cached per list.
+
+    Callers that append to the results list must add to the returned set
+    as well so the cached pair stays consistent.
+    """
+    global _results_ids_cache
+    results = load_results()
+    cached_list, cached_ids = _results_ids_cache
+    if cached_list is results:
+        return results, cached_ids
+    existing_ids = {str(item.get("eventId")) for item in results if item.get("eventId")}
+    _results_ids_cache = (results, existing_ids)
+    return results, existing_ids
+
+
+def _score(competitor: dict) -> int:
+    """Read a competitor's score once, treating missing/empty/bad as 0."""
+    s = competitor.get("score")
+    try:
+        return int(s) if s else 0
+    except (TypeError, ValueError):
+        return 0
+
+
 def update_results(days_back: int = 7) -> None:
     """Update the results database with completed matches from recent days.
 
@@ -192,51 +424,124 @@ def update_results(days_back: int = 7) -> None:
     Args:
         days_back: How many days in the past to check.  Defaults to 7.
     """
-    results = load_results()
-    existing_ids = {str(item.get("eventId")) for item in results if item.get("eventId")}
-    tz = pytz.timezone("Europe/London")
-    today = datetime.datetime.now(tz)
-    # Iterate over each day in the past
-    for delta in range(1, days_back + 1):
-        date = today - datetime.timedelta(days=delta)
-        date_str = date.strftime("%Y%m%d")
-        for league in LEAGUE_CODES:
-            scoreboard = fetch_scoreboard(league, date_str)
-            if not scoreboard:
+    results, existing_ids = _results_with_ids()
+    today = datetime.datetime.now(_TZ_LONDON)
+    # Fetch the full day x league grid in parallel, then process the
+    # responses in order
+    date_strs = [(today - datetime.timedelta(days=delta)).strftime("%Y%m%d")
+                 for delta in range(1, days_back + 1)]
+    grid = [(league, date_str) for date_str in date_strs for league in LEAGUE_CODES]
+    if AIOHTTP_AVAILABLE:
+        # Multiplex the whole grid over a few connections to ESPN
+        scoreboards = asyncio.run(_fetch_scoreboards_async(grid))
+    else:
+        futures = [_HTTP_POOL.submit(fetch_scoreboard, league, date_str)
+                   for league, date_str in grid]
+        scoreboards = {key: future.result() for key, future in zip(grid, futures)}
+    dirty = False
+    for league, date_str in grid:
+        scoreboard = scoreboards.get((league, date_str))
+        if not scoreboard:
+            continue
+        for event in scoreboard.get("events", []):
+            event_id = str(event.get("id"))
+            # Skip if we've already stored this event
+            if event_id in existing_ids:
+                continue
+            competitions = event.get("competitions", [])
+            if not competitions:
                 continue
-            for event in scoreboard.get("events", []):
-                event_id = str(event.get("id"))
-                # Skip if we've already stored this event
-                if event_id in existing_ids:
-                    continue
-                competitions = event.get("competitions", [])
-                if not competitions:
-                    continue
-                comp = competitions[0]
-                competitors = comp.get("competitors", [])
-                if len(competitors) != 2:
-                    continue
-                home_comp = next((c for c in competitors if c.get("homeAway") == "home"), None)
-                away_comp = next((c for c in competitors if c.get("homeAway") == "away"), None)
-                if not home_comp or not away_comp:
-                    home_comp, away_comp = competitors[0], competitors[1]
-                home_score = int(home_comp.get("score", 0)) if home_comp.get("score") else 0
-                away_score = int(away_comp.get("score", 0)) if away_comp.get("score") else 0
-                # Determine if the match has been played.  Skip scheduled/pre matches.
-                state = event.get("status", {}).get("type", {}).get("state", "")
-                if state == "pre":
-                    continue
-                results.append({
-                    "eventId": event_id,
-                    "date": date_str,
-                    "league": league,
-                    "homeTeam": home_comp.get("team", {}).get("displayName", ""),
-                    "awayTeam": away_comp.get("team", {}).get("displayName", ""),
-                    "homeScore": home_score,
-                    "awayScore": away_score,
-                })
-                existing_ids.add(event_id)
-    save_results(results)
+            comp = competitions[0]
+            competitors = comp.get("competitors", [])
+            if len(competitors) != 2:
+                continue
+            # Unrolled: one homeAway check decides the order (see
+            # parse_events_from_scoreboard)
+            c0, c1 = competitors
+            if c0.get("homeAway") == "away":
+                home_comp, away_comp = c1, c0
+            else:
+                home_comp, away_comp = c0, c1
+            home_score = _score(home_comp)
+            away_score = _score(away_comp)
+            # Determine if the match has been played.  Skip scheduled/pre matches.
+            state = event.get("status", {}).get("type", {}).get("state", "")
+            if state == "pre":
+                continue
+            results.append({
+                "eventId": event_id,
+                "date": date_str,
+                "league": league,
+                "homeTeam": home_comp.get("team", {}).get("displayName", ""),
+                "awayTeam": away_comp.get("team", {}).get("displayName", ""),
+                "homeScore": home_score,
+                "awayScore": away_score,
+            })
+            existing_ids.add(event_id)
+            dirty = True
+    # Nothing new means nothing to rewrite
+    if dirty:
+        save_results(results)
+
+
+# Below this many results the pure-Python loop wins; NumPy's array setup
+# only pays off on larger histories.
+_NUMPY_MIN_RESULTS = 2000
+
+
+def _scoring_rates_numpy(teams, scored):
+    """Return (sorted team array, per-team scoring rate) for one venue.
+
+    ``teams`` is an array of team names and ``scored`` a parallel 0/1
+    array marking whether that team scored.  Teams are aggregated with
+    bincount; a team with no games gets the 0.5 default downstream.
+    """
+    index, inverse = np.unique(teams, return_inverse=True)
+    games = np.bincount(inverse, minlength=len(index)).astype(np.float64)
+    scored_cnt = np.bincount(inverse, weights=scored, minlength=len(index))
+    rates = np.where(games > 0, scored_cnt / np.maximum(games, 1.0), 0.5)
+    return index, rates
+
+
+def _lookup_rate(index, rates, team: str) -> float:
+    """Look up a team's scoring rate, defaulting to 0.5 when unseen."""
+    pos = np.searchsorted(index, team)
+    if pos < len(index) and index[pos] == team:
+        return float(rates[pos])
+    return 0.5
+
+
+def _compute_btts_predictions_numpy(results: List[dict], upcoming_events: List[dict]) -> List[dict]:
+    """Vectorized variant of :func:`compute_btts_predictions`.
+
+    The per-result Python loop is replaced with two bincount aggregations
+    over NumPy arrays, which dominates on histories of thousands of
+    results.  Output matches the pure-Python implementation.
+    """
+    teams_home = np.array([r.get("homeTeam") or "" for r in results])
+    scored_home = np.fromiter(
+        (int(r.get("homeScore") or 0) > 0 for r in results), dtype=np.float64, count=len(results)
+    )
+    teams_away = np.array([r.get("awayTeam") or "" for r in results])
+    scored_away = np.fromiter(
+        (int(r.get("awayScore") or 0) > 0 for r in results), dtype=np.float64, count=len(results)
+    )
+    home_index, home_rates = _scoring_rates_numpy(teams_home, scored_home)
+    away_index, away_rates = _scoring_rates_numpy(teams_away, scored_away)
+    predictions: List[dict] = []
+    for event in upcoming_events:
+        home = event.get("homeTeam", "")
+        away = event.get("awayTeam", "")
+        prob = _lookup_rate(home_index, home_rates, home) * _lookup_rate(away_index, away_rates, away)
+        predictions.append({
+            "eventId": event.get("eventId"),
+            "league": event.get("league"),
+            "homeTeam": home,
+            "awayTeam": away,
+            "probability": prob,
+        })
+    predictions.sort(key=itemgetter("probability"), reverse=True)
+    return predictions
 
 
 def compute_btts_predictions(results: List[dict], upcoming_events: List[dict]) -> List[dict]:
@@ -257,36 +562,36 @@ def compute_btts_predictions(results: List[dict], upcoming_events: List[dict]) -
         A list of dictionaries with keys: eventId, league, homeTeam,
         awayTeam and probability, sorted descending by probability.
     """
-    # Build per-team statistics for scoring at home/away
-    team_stats: Dict[str, Dict[str, int]] = {}
+    if NUMPY_AVAILABLE and len(results) >= _NUMPY_MIN_RESULTS:
+        return _compute_btts_predictions_numpy(results, upcoming_events)
+    # Build per-team statistics for scoring at home/away in a single pass.
+    # Stats are stored as [home_games, home_scored, away_games, away_scored]
+    # lists; a defaultdict avoids the double setdefault per result.
+    team_stats: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0, 0])
     for r in results:
-        home = r.get("homeTeam") or ""
-        away = r.get("awayTeam") or ""
-        # Initialise stats entries
-        team_stats.setdefault(home, {"home_games": 0, "home_scored": 0, "away_games": 0, "away_scored": 0})
-        team_stats.setdefault(away, {"home_games": 0, "home_scored": 0, "away_games": 0, "away_scored": 0})
-        # Update home team stats
-        team_stats[home]["home_games"] += 1
-        if r.get("homeScore", 0) and int(r["homeScore"]) > 0:
-            team_stats[home]["home_scored"] += 1
-        # Update away team stats
-        team_stats[away]["away_games"] += 1
-        if r.get("awayScore", 0) and int(r["awayScore"]) > 0:
-            team_stats[away]["away_scored"] += 1
+        home_score = int(r.get("homeScore") or 0)
+        away_score = int(r.get("awayScore") or 0)
+        h = team_stats[r.get("homeTeam") or ""]
+        h[0] += 1
+        h[1] += home_score > 0
+        a = team_stats[r.get("awayTeam") or ""]
+        a[2] += 1
+        a[3] += away_score > 0
+    team_stats_get = team_stats.get
     predictions: List[dict] = []
     for event in upcoming_events:
         home = event.get("homeTeam", "")
         away = event.get("awayTeam", "")
         # Home scoring probability
-        h_stats = team_stats.get(home)
-        if h_stats and h_stats["home_games"] > 0:
-            p_home = h_stats["home_scored"] / float(h_stats["home_games"])
+        h_stats = team_stats_get(home)
+        if h_stats and h_stats[0] > 0:
+            p_home = h_stats[1] / float(h_stats[0])
         else:
             p_home = 0.5
         # Away scoring probability
-        a_stats = team_stats.get(away)
-        if a_stats and a_stats["away_games"] > 0:
-            p_away = a_stats["away_scored"] / float(a_stats["away_games"])
+        a_stats = team_stats_get(away)
+        if a_stats and a_stats[2] > 0:
+            p_away = a_stats[3] / float(a_stats[2])
         else:
             p_away = 0.5
         prob = p_home * p_away
@@ -298,7 +603,7 @@ def compute_btts_predictions(results: List[dict], upcoming_events: List[dict]) -
             "probability": prob,
         })
     # Sort descending by probability
-    predictions.sort(key=lambda x: x.get("probability", 0), reverse=True)
+    predictions.sort(key=itemgetter("probability"), reverse=True)
     return predictions
 
 
@@ -323,31 +628,50 @@ def save_settings(settings: Dict[str, str]) -> None:
         val = settings.get(key)
         if val not in (None, ""):
             to_save[key] = val
-    with open(SETTINGS_FILE, "w") as f:
-        json.dump(to_save, f)
+    _enqueue_json_write(SETTINGS_FILE, to_save)
+
+
+# Index of manual matches keyed by eventId, rebuilt whenever the file is
+# re-read.  Gives O(1) existence checks in remove_manual_match instead of
+# scanning and rewriting the list when the id is absent.
+_manual_matches_by_id: Dict[str, dict] = {}
+_manual_matches_indexed: Optional[List[dict]] = None
+
+# Most installs never add a manual match; once the file is known to be
+# missing, skip even the stat on the steady-state path.  The flag is
+# cleared by save_manual_matches, the only in-process writer.
+_manual_matches_absent = False
 
 
 def load_manual_matches() -> List[dict]:
     """Load manually added matches from disk.
-    
+
     Returns a list of match dictionaries with keys: eventId, homeTeam,
     awayTeam, league, kickoffTime, title, status.
     """
-    try:
-        with open(MANUAL_MATCHES_FILE, "r") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return data
-    except Exception:
-        pass
-    return []
+    global _manual_matches_indexed, _manual_matches_absent
+    if _manual_matches_absent:
+        return []
+    data = _load_json_file(MANUAL_MATCHES_FILE)
+    if data is None and not os.path.exists(MANUAL_MATCHES_FILE):
+        _manual_matches_absent = True
+    matches = data if isinstance(data, list) else []
+    if matches is not _manual_matches_indexed:
+        _manual_matches_by_id.clear()
+        for m in matches:
+            eid = m.get("eventId")
+            if eid:
+                _manual_matches_by_id[eid] = m
+        _manual_matches_indexed = matches
+    return matches
 
 
 def save_manual_matches(matches: List[dict]) -> None:
     """Persist manually added matches to disk."""
+    global _manual_matches_absent
     try:
-        with open(MANUAL_MATCHES_FILE, "w") as f:
-            json.dump(matches, f, indent=2)
+        _write_json_file(MANUAL_MATCHES_FILE, matches, pretty=True)
+        _manual_matches_absent = False
     except Exception as e:
         print(f"Error saving manual matches: {e}")
 
@@ -382,6 +706,7 @@ def add_manual_match(home_team: str, away_team: str, league: str, kickoff_time:
     }
     
     matches.append(new_match)
+    _manual_matches_by_id[event_id] = new_match
     save_manual_matches(matches)
     
     # Add to event league map
@@ -390,25 +715,87 @@ def add_manual_match(home_team: str, away_team: str, league: str, kickoff_time:
     return event_id
 
 
+def add_manual_matches_batch(entries: List[dict]) -> List[dict]:
+    """Add several manual matches in a single load/save cycle.
+
+    Unlike calling :func:`add_manual_match` in a loop, this reads and
+    writes the manual matches file exactly once regardless of how many
+    entries are supplied.
+
+    Args:
+        entries: List of dicts with homeTeam, awayTeam, league and
+            kickoffTime keys (same shape as the single-match endpoint).
+
+    Returns:
+        A per-entry list of result dicts with success, message and
+        (when successful) eventId keys, in the same order as entries.
+    """
+    import time
+    matches = load_manual_matches()
+    results: List[dict] = []
+    base_ts = int(time.time())
+    for idx, entry in enumerate(entries):
+        home_team = (entry.get("homeTeam") or "").strip()
+        away_team = (entry.get("awayTeam") or "").strip()
+        league = (entry.get("league") or "sco.4").strip()
+        kickoff_time = (entry.get("kickoffTime") or "TBD").strip()
+        if not home_team or not away_team:
+            results.append({"success": False, "message": "Home and away teams are required"})
+            continue
+        # Suffix with the index so IDs stay unique within one batch
+        event_id = f"manual_{base_ts}_{idx}"
+        new_match = {
+            "eventId": event_id,
+            "homeTeam": home_team,
+            "awayTeam": away_team,
+            "league": league,
+            "kickoffTime": kickoff_time,
+            "title": f"{home_team} vs {away_team}",
+            "status": kickoff_time,
+            "source": "manual"
+        }
+        matches.append(new_match)
+        _manual_matches_by_id[event_id] = new_match
+        event_league_map[event_id] = league
+        results.append({"success": True, "message": "Added", "eventId": event_id})
+    save_manual_matches(matches)
+    return results
+
+
 def remove_manual_match(event_id: str) -> bool:
     """Remove a manual match by its event ID.
     
     Returns True if match was found and removed, False otherwise.
     """
     matches = load_manual_matches()
-    original_len = len(matches)
+    if event_id not in _manual_matches_by_id:
+        return False
+    del _manual_matches_by_id[event_id]
     matches = [m for m in matches if m.get("eventId") != event_id]
-    
-    if len(matches) < original_len:
-        save_manual_matches(matches)
-        return True
-    return False
+    save_manual_matches(matches)
+    return True
+
 
+# Cache mapping event IDs to their corresponding league code.  This
+# allows the API to look up the correct league when retrieving detailed
+# information for a specific match.  It is reloaded from disk at startup
+# so a restart does not pay up to len(LEAGUE_CODES) probe requests per
+# tracked event, and snapshotted through the write-behind flusher.
+EVENT_LEAGUE_MAP_FILE = os.path.join(os.path.dirname(__file__), "event_league_map.json")
 
-# In-memory cache mapping event IDs to their corresponding league code.
-# This allows the API to look up the correct league when retrieving
-# detailed information for a specific match.
 event_league_map: Dict[str, str] = {}
+_saved_event_league_map = _load_json_file(EVENT_LEAGUE_MAP_FILE)
+if isinstance(_saved_event_league_map, dict):
+    event_league_map.update(_saved_event_league_map)
+del _saved_event_league_map
+
+
+def _persist_event_league_map() -> None:
+    """Schedule a debounced snapshot of the event -> league mapping."""
+    try:
+        _enqueue_json_write(EVENT_LEAGUE_MAP_FILE, dict(event_league_map))
+    except Exception:
+        pass
 
 
 def get_today_date_str(timezone: str = "Europe/London") -> str:
@@ -418,7 +805,7 @@ def get_today_date_str(timezone: str = "Europe/London") -> str:
     supplied because the API expects the date relative to local time in
     the user's locale (Europe/London for this project).
     """
-    tz = pytz.timezone(timezone)
+    tz = _TZ_LONDON if timezone == "Europe/London" else pytz.timezone(timezone)
     now = datetime.datetime.now(tz)
     return now.strftime("%Y%m%d")
 
@@ -431,12 +818,11 @@ def load_assignments() -> Dict[str, Optional[str]]:
     or is invalid, a fresh mapping with all values set to None is
     returned.  Additional names not present in FRIEND_NAMES are ignored.
     """
-    try:
-        with open(ASSIGNMENTS_FILE, "r") as f:
-            data = json.load(f)
+    data = _load_json_file(ASSIGNMENTS_FILE)
+    if isinstance(data, dict):
         # Ensure that we only include the expected names
         assignments = {name: data.get(name) for name in FRIEND_NAMES}
-    except Exception:
+    else:
         assignments = {name: None for name in FRIEND_NAMES}
     return assignments
 
@@ -448,8 +834,7 @@ def save_assignments(assignments: Dict[str, Optional[str]]) -> None:
     corresponding to FRIEND_NAMES are stored.  Other keys are ignored.
     """
     data = {name: assignments.get(name) for name in FRIEND_NAMES}
-    with open(ASSIGNMENTS_FILE, "w") as f:
-        json.dump(data, f)
+    _enqueue_json_write(ASSIGNMENTS_FILE, data)
 
 
 def load_groups() -> Dict[str, str]:
@@ -460,28 +845,19 @@ def load_groups() -> Dict[str, str]:
     assignment is generated where the first half of FRIEND_NAMES are
     "top" and the remainder are "bottom".
     """
-    try:
-        with open(GROUPS_FILE, "r") as f:
-            data = json.load(f)
-        # Only include expected names and valid values
-        groups: Dict[str, str] = {}
-        half = len(FRIEND_NAMES) // 2
-        for idx, name in enumerate(FRIEND_NAMES):
-            val = None
-            if isinstance(data, dict):
-                val = data.get(name)
-            # Accept "sixer" in addition to "top" and "bottom".  If the value
-            # from the file is not one of these, fall back to the default top/bottom
-            # split based on position.
-            if val in {"top", "bottom", "sixer"}:
-                groups[name] = val
-            else:
-                groups[name] = "top" if idx < half else "bottom"
-    except Exception:
-        # Default assignment: split friends evenly into top and bottom
-        groups = {}
-        half = len(FRIEND_NAMES) // 2
-        for idx, name in enumerate(FRIEND_NAMES):
+    data = _load_json_file(GROUPS_FILE)
+    # Only include expected names and valid values; anything missing or
+    # unexpected falls back to the default top/bottom split by position.
+    groups: Dict[str, str] = {}
+    half = len(FRIEND_NAMES) // 2
+    for idx, name in enumerate(FRIEND_NAMES):
+        val = None
+        if isinstance(data, dict):
+            val = data.get(name)
+        # Accept "sixer" in addition to "top" and "bottom".
+        if val in {"top", "bottom", "sixer"}:
+            groups[name] = val
+        else:
             groups[name] = "top" if idx < half else "bottom"
     return groups
 
@@ -499,8 +875,50 @@ def save_groups(groups: Dict[str, str]) -> None:
         # group assignments.  Any other values are ignored.
         if val in {"top", "bottom", "sixer"}:
             data[name] = val
-    with open(GROUPS_FILE, "w") as f:
-        json.dump(data, f)
+    _enqueue_json_write(GROUPS_FILE, data)
+
+
+def _prune_ttl_cache(cache: Dict, max_entries: int) -> None:
+    """Drop expired entries once a TTL cache grows beyond its size cap.
+
+    These caches are keyed by request-derived values (dates, ranges,
+    event ids), so without a cap a client cycling distinct keys could
+    grow them without bound.  Expired entries go first; if live entries
+    alone still exceed the cap the cache is cleared outright, the same
+    last resort as _red_card_cache.
+    """
+    if len(cache) <= max_entries:
+        return
+    now = time.time()
+    for key in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+        del cache[key]
+    if len(cache) > max_entries:
+        cache.clear()
+
+
+# Scoreboard TTL cache mapping (league, date) -> (expiry, data).
+# Today's scoreboards change constantly so entries only live 30 s; past
+# single-day dates are final and can be held for an hour.  Date ranges
+# always get the short TTL since they may extend into the future.
+SCOREBOARD_CACHE_TTL = 30
+SCOREBOARD_CACHE_TTL_PAST = 3600
+SCOREBOARD_CACHE_MAX_ENTRIES = 1024
+_scoreboard_cache: Dict[tuple, tuple] = {}
+
+
+def _scoreboard_ttl(date: str) -> int:
+    """TTL for a scoreboard entry: long for finished past days."""
+    if "-" not in date and date < get_today_date_str():
+        return SCOREBOARD_CACHE_TTL_PAST
+    return SCOREBOARD_CACHE_TTL
+
+
+# Shared worker pool and pooled HTTP session: per-league scoreboard
+# fetches run in parallel and reuse TCP/TLS connections across leagues
+# and days instead of paying a handshake per call.
+_HTTP_POOL = ThreadPoolExecutor(max_workers=16)
+_http_session = requests.Session()
+_http_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32))
 
 
 def fetch_scoreboard(league: str, date: str) -> Optional[dict]:
@@ -511,10 +929,14 @@ def fetch_scoreboard(league: str, date: str) -> Optional[dict]:
     message when there are no events for the requested date, so the
     caller should handle a None return value accordingly.
     """
+    cache_key = (league, date)
+    cached = _scoreboard_cache.get(cache_key)
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
     url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{league}/scoreboard"
     params = {"dates": date}
     try:
-        resp = requests.get(url, params=params, timeout=10)
+        resp = _http_session.get(url, params=params, timeout=10)
         # ESPN returns a 400 with a JSON body when no events are found
         # or when the parameters are invalid.  Attempt to parse the
         # response regardless of status code so that we can detect
@@ -524,9 +946,106 @@ def fetch_scoreboard(league: str, date: str) -> Optional[dict]:
         return None
     if not isinstance(data, dict) or "events" not in data:
         return None
+    _prune_ttl_cache(_scoreboard_cache, SCOREBOARD_CACHE_MAX_ENTRIES)
+    _scoreboard_cache[cache_key] = (time.time() + _scoreboard_ttl(date), data)
     return data
 
 
+async def _fetch_scoreboards_async(keys: List[tuple]) -> Dict[tuple, Optional[dict]]:
+    """Fetch many (league, date) scoreboards concurrently with aiohttp.
+
+    Cached entries are served from _scoreboard_cache; the misses share
+    one connector to the single ESPN host and land back in the cache
+    with the usual TTL.  Failed fetches map to None, mirroring
+    :func:`fetch_scoreboard`.
+    """
+    results: Dict[tuple, Optional[dict]] = {}
+    misses: List[tuple] = []
+    now = time.time()
+    for key in keys:
+        cached = _scoreboard_cache.get(key)
+        if cached is not None and cached[0] > now:
+            results[key] = cached[1]
+        else:
+            misses.append(key)
+    if not misses:
+        return results
+
+    semaphore = asyncio.Semaphore(16)
+
+    async def fetch_one(session: "aiohttp.ClientSession", league: str, date: str):
+        url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{league}/scoreboard"
+        try:
+            async with semaphore:
+                async with session.get(url, params={"dates": date}) as resp:
+                    raw = await resp.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except Exception:
+            return (league, date), None
+        if not isinstance(data, dict) or "events" not in data:
+            return (league, date), None
+        _prune_ttl_cache(_scoreboard_cache, SCOREBOARD_CACHE_MAX_ENTRIES)
+        _scoreboard_cache[(league, date)] = (time.time() + _scoreboard_ttl(date), data)
+        return (league, date), data
+
+    connector = aiohttp.TCPConnector(limit_per_host=16)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        fetched = await asyncio.gather(
+            *(fetch_one(session, league, date) for league, date in misses)
+        )
+    results.update(fetched)
+    return results
+
+
+# Aggregated events cache keyed by date-range parameter.  The upcoming
+# and predictions endpoints share identical ranges and the frontend
+# polls them together, so the parse/dedupe/sort work is reused briefly.
+AGGREGATE_CACHE_TTL = 20
+AGGREGATE_CACHE_MAX_ENTRIES = 256
+_aggregate_cache: Dict[str, tuple] = {}
+
+
+def _aggregate_events(date_range_param: str) -> List[dict]:
+    """Fetch, parse, dedupe and title-sort events across all leagues.
+
+    Shared by the search, upcoming and predictions endpoints.  Leagues
+    are fetched concurrently; duplicates (a match surfacing in two
+    league feeds) are collapsed by eventId.
+    """
+    cached = _aggregate_cache.get(date_range_param)
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
+    all_events: List[dict] = []
+    futures = [_HTTP_POOL.submit(fetch_scoreboard, league, date_range_param)
+               for league in LEAGUE_CODES]
+    for league, future in zip(LEAGUE_CODES, futures):
+        scoreboard = future.result()
+        if scoreboard:
+            all_events.extend(parse_events_from_scoreboard(scoreboard, league))
+    unique_events = {e["eventId"]: e for e in all_events}
+    events = sorted(unique_events.values(), key=itemgetter("title"))
+    _prune_ttl_cache(_aggregate_cache, AGGREGATE_CACHE_MAX_ENTRIES)
+    _aggregate_cache[date_range_param] = (time.time() + AGGREGATE_CACHE_TTL, events)
+    return events
+
+
+@lru_cache(maxsize=4096)
+def _format_kickoff(iso_str: str) -> str:
+    """Format an ESPN ISO 8601 UTC kickoff as a UK-local label.
+
+    ESPN returns the same timestamp for a fixture on every poll, so the
+    parse/convert/format work is memoized on the raw string.  Raises on
+    unparseable input; callers keep their own fallback.
+    """
+    dt_utc = _parse_iso_utc(iso_str)
+    dt_local = dt_utc.astimezone(_TZ_LONDON)
+    day_name = dt_local.strftime("%a")
+    month_name = dt_local.strftime("%B")
+    hour_min = dt_local.strftime("%I:%M %p").lstrip("0")
+    return f"{day_name}, {month_name} {dt_local.day} at {hour_min} UK"
+
+
 def parse_events_from_scoreboard(data: dict, league: str) -> List[dict]:
     """Parse the events from a scoreboard response into a simplified list.
 
@@ -542,22 +1061,24 @@ def parse_events_from_scoreboard(data: dict, league: str) -> List[dict]:
     for event in data.get("events", []):
         event_id = str(event.get("id"))
         # Each event has a "competitions" list with details about the match
-        competitions = event.get("competitions", [])
+        competitions = event.get("competitions") or []
         if not competitions:
             continue
         comp = competitions[0]
         # The competitors array includes two teams with a "homeAway" property
-        competitors = comp.get("competitors", [])
+        competitors = comp.get("competitors") or ()
         if len(competitors) != 2:
             continue
-        home_comp = next((c for c in competitors if c.get("homeAway") == "home"), None)
-        away_comp = next((c for c in competitors if c.get("homeAway") == "away"), None)
-        if not home_comp or not away_comp:
-            # If home/away isn't set, assume first is home
-            home_comp, away_comp = competitors[0], competitors[1]
-        home_team = home_comp.get("team", {}).get("displayName", "")
-        away_team = away_comp.get("team", {}).get("displayName", "")
-        status_type = event.get("status", {}).get("type", {})
+        # Unrolled: two competitors, so one homeAway check decides the
+        # order; when it isn't set, assume the first is home
+        c0, c1 = competitors
+        if c0.get("homeAway") == "away":
+            home_comp, away_comp = c1, c0
+        else:
+            home_comp, away_comp = c0, c1
+        home_team = (home_comp.get("team") or {}).get("displayName", "")
+        away_team = (away_comp.get("team") or {}).get("displayName", "")
+        status_type = (event.get("status") or {}).get("type") or {}
         # Convert scheduled times into UK local time.  ESPN provides the
         # match start time in the event "date" field as an ISO 8601 UTC
         # timestamp (e.g., "2025-08-08T19:00Z").  When the match is
@@ -567,23 +1088,13 @@ def parse_events_from_scoreboard(data: dict, league: str) -> List[dict]:
         # provided by ESPN (e.g., "FT", "Half Time", etc.).
         status_description = status_type.get("detail", "")
         if status_type.get("state") == "pre":
-            # Only convert times for scheduled matches
-            event_date_str = event.get("date")
+            # Only convert times for scheduled matches; the memoized
+            # formatter produces e.g. "Fri, August 8 at 8:00 PM UK"
             try:
-                # Parse the ISO 8601 date string, which is in UTC
-                dt_utc = datetime.datetime.fromisoformat(event_date_str.replace("Z", "+00:00"))
-                # Convert to Europe/London timezone
-                tz_london = pytz.timezone("Europe/London")
-                dt_local = dt_utc.astimezone(tz_london)
-                # Format: Fri, August 8 at 8:00 PM UK (no leading zeros on hour/day)
-                day_name = dt_local.strftime("%a")
-                month_name = dt_local.strftime("%B")
-                day = dt_local.day
-                hour_min = dt_local.strftime("%I:%M %p").lstrip("0")
-                status_description = f"{day_name}, {month_name} {day} at {hour_min} UK"
+                status_description = _format_kickoff(event.get("date"))
             except Exception:
-                # Fallback to the original detail on parsing errors
-                status_description = status_type.get("detail", "")
+                # Keep the original detail on parsing errors
+                pass
         title = f"{home_team} vs {away_team}"
         events.append({
             "eventId": event_id,
@@ -593,8 +1104,11 @@ def parse_events_from_scoreboard(data: dict, league: str) -> List[dict]:
             "title": title,
             "status": status_description,
         })
-        # Update the event->league mapping so summary calls know where to look
-        event_league_map[event_id] = league
+    # Update the event->league mapping in one C-level call so summary
+    # lookups know where to look, instead of a dict write per event
+    event_league_map.update((e["eventId"], league) for e in events)
+    if events:
+        _persist_event_league_map()
     return events
 
 
@@ -618,52 +1132,64 @@ def api_matches():
     date_str = request.args.get("date")
     if date_str is None:
         date_str = get_today_date_str()
-    
-    all_events: List[dict] = []
-    
+
+    title_key = itemgetter("title")
+    # Per-source lists, each sorted by title; merged below
+    per_source: List[List[dict]] = []
+
     # Try to import the multi-API aggregator
     try:
-        from api_aggregator import fetch_all_matches, convert_to_app_format
+        from api_aggregator import fetch_all_leagues_sync, convert_to_app_format
         use_aggregator = True
     except ImportError:
         use_aggregator = False
-    
-    for league in LEAGUE_CODES:
-        if use_aggregator:
-            try:
-                # Use multi-API aggregator (ESPN + TheSportsDB + Football-Data)
-                matches = fetch_all_matches(league, date_str)
-                converted = convert_to_app_format(matches)
-                all_events.extend(converted)
-            except Exception:
-                # Fallback to ESPN-only if aggregator fails
-                scoreboard = fetch_scoreboard(league, date_str)
-                if scoreboard:
-                    events = parse_events_from_scoreboard(scoreboard, league)
-                    all_events.extend(events)
-        else:
-            # ESPN-only (original behavior)
-            scoreboard = fetch_scoreboard(league, date_str)
+
+    if use_aggregator:
+        try:
+            # Use multi-API aggregator (ESPN + TheSportsDB + Football-Data).
+            # All leagues are fetched concurrently in a single event loop.
+            matches = fetch_all_leagues_sync(LEAGUE_CODES, date_str)
+            per_source.append(sorted(convert_to_app_format(matches), key=title_key))
+        except Exception:
+            use_aggregator = False
+    if not use_aggregator:
+        # ESPN-only (original behavior), fetched in parallel per league
+        futures = [_HTTP_POOL.submit(fetch_scoreboard, league, date_str)
+                   for league in LEAGUE_CODES]
+        for league, future in zip(LEAGUE_CODES, futures):
+            scoreboard = future.result()
             if scoreboard:
                 events = parse_events_from_scoreboard(scoreboard, league)
-                all_events.extend(events)
-    
+                if events:
+                    events.sort(key=title_key)
+                    per_source.append(events)
+
     # Add manually entered matches
     manual_matches = load_manual_matches()
-    all_events.extend(manual_matches)
-    
-    # Sort events by title for better user experience
-    all_events.sort(key=lambda e: e["title"])
-    return jsonify(all_events)
+    if manual_matches:
+        per_source.append(sorted(manual_matches, key=title_key))
+
+    # Keep the alphabetical order the frontend relies on, but get it via
+    # a linear k-way merge of the pre-sorted per-source lists, feeding
+    # the streamed response as it goes
+    return _stream_json_list(heapq.merge(*per_source, key=title_key))
+
 
 
+# Precompiled once instead of per summary payload: digit extraction for
+# displayValue strings and the red-card keyword alternations.  Matching
+# case-insensitively in the regex saves a .lower() copy of every joined
+# stat/commentary string.
+_DIGITS_RE = re.compile(r"\d+")
+_RED_CARD_RE = re.compile(r"red card|straight red|second yellow", re.I)
+_RED_CARD_TEXT_RE = re.compile(r"red card", re.I)
+
 
 def _count_red_cards_from_summary(data: dict, home_team_id: str, away_team_id: str):
     """
     Best-effort counter for red cards per team from an ESPN soccer summary payload.
     Returns (home_reds, away_reds). If not found, both are 0.
     """
-    import re as _re
     try:
         home_reds = 0
         away_reds = 0
@@ -693,13 +1219,13 @@ def _count_red_cards_from_summary(data: dict, home_team_id: str, away_team_id: s
                             s.get("name",""), s.get("displayName",""), s.get("shortDisplayName",""),
                             s.get("abbreviation",""), s.get("label","")
                         ]
-                        joined = " ".join([str(v) for v in values]).lower()
-                        if "red card" in joined:
+                        joined = " ".join([str(v) for v in values])
+                        if _RED_CARD_TEXT_RE.search(joined):
                             v = s.get("value")
                             if v is None:
                                 dv = s.get("displayValue")
                                 try:
-                                    v = int(_re.findall(r"\d+", str(dv))[0]) if dv is not None else 0
+                                    v = int(_DIGITS_RE.findall(str(dv))[0]) if dv is not None else 0
                                 except Exception:
                                     v = 0
                             try:
@@ -720,8 +1246,8 @@ def _count_red_cards_from_summary(data: dict, home_team_id: str, away_team_id: s
             possible.append((data or {}).get("plays"))
         for arr in possible:
             for ev in arr:
-                joined = " ".join([str(ev.get(k,"")) for k in ("type","card","text","detail","playType","headline")]).lower()
-                if "red card" in joined or "straight red" in joined or "second yellow" in joined:
+                joined = " ".join([str(ev.get(k,"")) for k in ("type","card","text","detail","playType","headline")])
+                if _RED_CARD_RE.search(joined):
                     tid = ev.get("teamId") or ev.get("team", {}).get("id") or ev.get("homeAway")
                     if tid in ("home","away"):
                         inc(home_team_id if tid=="home" else away_team_id, 1)
@@ -731,8 +1257,8 @@ def _count_red_cards_from_summary(data: dict, home_team_id: str, away_team_id: s
         hdr = (data or {}).get("header", {})
         if isinstance(hdr.get("incidents"), list):
             for incd in hdr.get("incidents"):
-                desc = " ".join([str(incd.get("text","")), str(incd.get("type",""))]).lower()
-                if "red card" in desc:
+                desc = " ".join([str(incd.get("text","")), str(incd.get("type",""))])
+                if _RED_CARD_TEXT_RE.search(desc):
                     inc(incd.get("team", {}).get("id"))
 
         home_reds = max(0, int(home_reds))
@@ -741,6 +1267,34 @@ def _count_red_cards_from_summary(data: dict, home_team_id: str, away_team_id: s
     except Exception:
         return 0, 0
 
+# Red-card counts keyed by (event_id, home_score, away_score, detail).
+# Any goal or clock tick changes the key, so entries self-invalidate;
+# the dict is cleared outright at the cap rather than tracking LRU order.
+_RED_CACHE_MAX_ENTRIES = 4096
+_red_card_cache: Dict[tuple, tuple] = {}
+
+
+def _red_cards_cached(event_id: str, data: dict, home_id: str, away_id: str,
+                      home_score: int, away_score: int, status_detail: str):
+    """Memoized wrapper around :func:`_count_red_cards_from_summary`."""
+    key = (event_id, home_score, away_score, status_detail)
+    cached = _red_card_cache.get(key)
+    if cached is None:
+        if len(_red_card_cache) >= _RED_CACHE_MAX_ENTRIES:
+            _red_card_cache.clear()
+        cached = _count_red_cards_from_summary(data, home_id, away_id)
+        _red_card_cache[key] = cached
+    return cached
+
+
+# Summary TTL cache mapping (event_id, league) -> (expiry, data).  The
+# notifier re-polls the same assignments every ~30 s and several friends
+# can share an event, so a short TTL removes most repeat round-trips.
+SUMMARY_CACHE_TTL = 25
+SUMMARY_CACHE_MAX_ENTRIES = 1024
+_summary_cache: Dict[tuple, tuple] = {}
+
+
 def fetch_match_summary(event_id: str, league: str) -> Optional[dict]:
     """Retrieve a match summary from ESPN given an event ID and league.
 
@@ -749,16 +1303,22 @@ def fetch_match_summary(event_id: str, league: str) -> Optional[dict]:
     event hasn't started yet) or the event belongs to a different
     league.  The caller may try other leagues if this returns None.
     """
+    cache_key = (event_id, league)
+    cached = _summary_cache.get(cache_key)
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
     url = f"https://site.api.espn.com/apis/site/v2/sports/soccer/{league}/summary"
     params = {"event": event_id}
     try:
-        resp = requests.get(url, params=params, timeout=10)
+        resp = _http_session.get(url, params=params, timeout=10)
         data = resp.json()
     except Exception:
         return None
     # A valid response will include a 'header' key
     if not isinstance(data, dict) or "header" not in data:
         return None
+    _prune_ttl_cache(_summary_cache, SUMMARY_CACHE_MAX_ENTRIES)
+    _summary_cache[cache_key] = (time.time() + SUMMARY_CACHE_TTL, data)
     return data
 
 
@@ -786,24 +1346,30 @@ def api_match(event_id: str):
             league = lg
             # Update mapping for faster lookups next time
             event_league_map[event_id] = lg
+            _persist_event_league_map()
             break
     if not data:
-        return jsonify({"error": "Match not found"}), 404
+        return _json_response({"error": "Match not found"}), 404
     header = data.get("header", {})
     competitions = header.get("competitions", [])
     if not competitions:
-        return jsonify({"error": "Match data unavailable"}), 500
+        return _json_response({"error": "Match data unavailable"}), 500
     comp = competitions[0]
     competitors = comp.get("competitors", [])
-    # Determine home and away and their scores
-    home_comp = next((c for c in competitors if c.get("homeAway") == "home"), None)
-    away_comp = next((c for c in competitors if c.get("homeAway") == "away"), None)
+    # Determine home and away in a single pass over the competitors
+    home_comp = away_comp = None
+    for c in competitors:
+        home_away = c.get("homeAway")
+        if home_away == "home":
+            home_comp = c
+        elif home_away == "away":
+            away_comp = c
     if not home_comp or not away_comp:
         home_comp, away_comp = competitors[0], competitors[1]
     home_team = home_comp.get("team", {}).get("displayName", "")
     away_team = away_comp.get("team", {}).get("displayName", "")
-    home_score = int(home_comp.get("score", 0)) if home_comp.get("score") else 0
-    away_score = int(away_comp.get("score", 0)) if away_comp.get("score") else 0
+    home_score = _score(home_comp)
+    away_score = _score(away_comp)
     # Status information
     comp_status = header.get("competitions", [{}])[0].get("status", {})
     status_type = comp_status.get("type", {})
@@ -817,14 +1383,13 @@ def api_match(event_id: str):
     event_date_str = header.get("competitions", [{}])[0].get("date")
     kickoff_time = ""
     try:
-        dt_utc = datetime.datetime.fromisoformat(event_date_str.replace("Z", "+00:00"))
-        tz_london = pytz.timezone("Europe/London")
-        dt_local = dt_utc.astimezone(tz_london)
+        dt_utc = _parse_iso_utc(event_date_str)
+        dt_local = dt_utc.astimezone(_TZ_LONDON)
         # Default kickoff time: 24‑hour HH:MM for non‑scheduled contexts
-        kickoff_time = dt_local.strftime("%H:%M")
+        kickoff_time = f"{dt_local.hour:02d}:{dt_local.minute:02d}"
         if state == "pre":
             # For scheduled games, include the day of week and 24‑hour time (e.g. Saturday 15:00)
-            kickoff_time = dt_local.strftime("%A %H:%M")
+            kickoff_time = f"{_WEEKDAYS[dt_local.weekday()]} {kickoff_time}"
             # Ensure status_detail is simply "Scheduled" or whatever ESPN provides; we leave
             # the status_detail unchanged here because the front‑end uses kickoff_time.
     except Exception:
@@ -837,8 +1402,9 @@ def api_match(event_id: str):
     except Exception:
         home_id = ''
         away_id = ''
-    home_red, away_red = _count_red_cards_from_summary(data, home_id, away_id)
-    return jsonify({
+    home_red, away_red = _red_cards_cached(event_id, data, home_id, away_id,
+                                           home_score, away_score, status_detail)
+    return _json_response({
         "eventId": event_id,
         "league": league,
         "homeTeam": home_team,
@@ -869,15 +1435,15 @@ def api_login():
     password = data.get("password")
     if password and password == ADMIN_PASSWORD:
         session["admin"] = True
-        return jsonify({"success": True})
-    return jsonify({"success": False, "error": "Invalid password"}), 401
+        return _json_response({"success": True})
+    return _json_response({"success": False, "error": "Invalid password"}), 401
 
 
 @app.route("/api/logout", methods=["POST"])
 def api_logout():
     """Log out the current admin session."""
     session.pop("admin", None)
-    return jsonify({"success": True})
+    return _json_response({"success": True})
 
 
 @app.route("/api/assignments", methods=["GET", "POST"])
@@ -892,18 +1458,19 @@ def api_assignments():
     authenticated, returns 401.  The assignments are saved to disk.
     """
     if request.method == "GET":
-        return jsonify(load_assignments())
+        return _json_response(load_assignments())
     # POST requires admin session
     if not session.get("admin"):
-        return jsonify({"error": "Unauthorized"}), 401
+        return _json_response({"error": "Unauthorized"}), 401
     data = request.get_json(silent=True) or {}
     assignments = load_assignments()
-    for name in FRIEND_NAMES:
-        # Accept empty string or None to clear the assignment
-        value = data.get(name)
-        assignments[name] = value if value else None
-    save_assignments(assignments)
-    return jsonify({"success": True})
+    # Accept empty string or None to clear an assignment; unknown keys
+    # are dropped.  Skip the disk write entirely when nothing changed.
+    new_assignments = {name: (data.get(name) or None) for name in FRIEND_NAMES}
+    if new_assignments == assignments:
+        return _json_response({"success": True, "noop": True})
+    save_assignments(new_assignments)
+    return _json_response({"success": True})
 
 
 @app.route("/api/groups", methods=["GET", "POST"])
@@ -918,10 +1485,10 @@ def api_groups():
     are ignored.  After saving, returns a success flag.
     """
     if request.method == "GET":
-        return jsonify(load_groups())
+        return _json_response(load_groups())
     # POST requires admin session
     if not session.get("admin"):
-        return jsonify({"error": "Unauthorized"}), 401
+        return _json_response({"error": "Unauthorized"}), 401
     data = request.get_json(silent=True) or {}
     groups = load_groups()
     updated: Dict[str, str] = {}
@@ -933,8 +1500,11 @@ def api_groups():
         else:
             # Preserve existing assignment if not provided
             updated[name] = groups.get(name, "top")
+    # Skip the disk write when the POST is a no-op
+    if updated == groups:
+        return _json_response({"success": True, "noop": True})
     save_groups(updated)
-    return jsonify({"success": True})
+    return _json_response({"success": True})
 
 
 @app.route("/api/settings", methods=["GET", "POST"])
@@ -947,15 +1517,15 @@ def api_settings():
     default for title).  On success, a success flag is returned.
     """
     if request.method == "GET":
-        return jsonify(load_settings())
+        return _json_response(load_settings())
     # POST requires admin session
     if not session.get("admin"):
-        return jsonify({"error": "Unauthorized"}), 401
+        return _json_response({"error": "Unauthorized"}), 401
     data = request.get_json(silent=True) or {}
     title = data.get("title") or "BTTS Match Tracker"
     message = data.get("message") or ""
     save_settings({"title": title, "message": message})
-    return jsonify({"success": True})
+    return _json_response({"success": True})
 
 
 @app.route("/api/search_matches")
@@ -983,26 +1553,14 @@ def api_search_matches():
     # Compose the dates parameter.  ESPN supports ranges like
     # yyyyMMdd-yyyyMMdd for multiple days【812553852205208†L331-L343】.
     dates_param = start_clean if start_clean == end_clean else f"{start_clean}-{end_clean}"
-    all_events: List[dict] = []
-    for league in LEAGUE_CODES:
-        scoreboard = fetch_scoreboard(league, dates_param)
-        if scoreboard:
-            events = parse_events_from_scoreboard(scoreboard, league)
-            all_events.extend(events)
-    # Remove duplicates (rare but possible when a match appears in multiple leagues) by eventId
-    unique_events: Dict[str, dict] = {}
-    for event in all_events:
-        unique_events[event["eventId"]] = event
-    # Convert to list and sort by title
-    sorted_events = sorted(unique_events.values(), key=lambda e: e["title"])
-    return jsonify(sorted_events)
+    return _json_response(_aggregate_events(dates_param))
 
 
 @app.route("/api/manual_matches", methods=["GET"])
 def get_manual_matches():
     """Return list of all manually added matches."""
     matches = load_manual_matches()
-    return jsonify(matches)
+    return _json_response(matches)
 
 
 @app.route("/api/manual_matches", methods=["POST"])
@@ -1020,7 +1578,7 @@ def create_manual_match():
     data = request.get_json()
     
     if not data:
-        return jsonify({"success": False, "message": "No data provided"}), 400
+        return _json_response({"success": False, "message": "No data provided"}), 400
     
     home_team = data.get("homeTeam", "").strip()
     away_team = data.get("awayTeam", "").strip()
@@ -1028,26 +1586,67 @@ def create_manual_match():
     kickoff_time = data.get("kickoffTime", "TBD").strip()
     
     if not home_team or not away_team:
-        return jsonify({"success": False, "message": "Home and away teams are required"}), 400
+        return _json_response({"success": False, "message": "Home and away teams are required"}), 400
     
     event_id = add_manual_match(home_team, away_team, league, kickoff_time)
     
-    return jsonify({
+    return _json_response({
         "success": True,
         "message": "Manual match added successfully",
         "eventId": event_id
     })
 
 
+@app.route("/api/manual_matches/batch", methods=["POST"])
+def create_manual_matches_batch():
+    """Add several manual matches in one request.
+
+    Expected JSON body:
+    {
+        "matches": [
+            {"homeTeam": "...", "awayTeam": "...", "league": "sco.4", "kickoffTime": "..."},
+            ...
+        ]
+    }
+
+    All matches are persisted with a single write, and a per-item
+    status list is returned so callers can report individual failures.
+    """
+    data = request.get_json(silent=True) or {}
+    entries = data.get("matches")
+
+    if not isinstance(entries, list) or not entries:
+        return _json_response({"success": False, "message": "No matches provided"}), 400
+
+    results = add_manual_matches_batch(entries)
+
+    return _json_response({
+        "success": all(r.get("success") for r in results),
+        "results": results
+    })
+
+
 @app.route("/api/manual_matches/<event_id>", methods=["DELETE"])
 def delete_manual_match(event_id):
     """Delete a manual match by its event ID."""
     success = remove_manual_match(event_id)
     
     if success:
-        return jsonify({"success": True, "message": "Match deleted"})
+        return _json_response({"success": True, "message": "Match deleted"})
     else:
-        return jsonify({"success": False, "message": "Match not found"}), 404
+        return _json_response({"success": False, "message": "Match not found"}), 404
+
+
+# Classes that look like match containers, for /debug/bbc.  The combined
+# regex goes straight to find_all so the first-pass filter runs inside
+# bs4 rather than as a Python check per element.
+_BBC_DEBUG_PATTERNS = (
+    'fixture', 'match', 'event', 'game',
+    'qa-fixture', 'sp-c-fixture',
+    'gel-layout', 'gs-c'
+)
+_BBC_DEBUG_CLASS_RE = re.compile('|'.join(_BBC_DEBUG_PATTERNS), re.I)
+_BBC_DEBUG_V_RE = re.compile('v', re.I)
 
 
 @app.route("/debug/bbc")
@@ -1061,7 +1660,7 @@ def debug_bbc():
         league = request.args.get("league", "sco.4")
         
         if league not in BBC_SCOTTISH_LEAGUES:
-            return jsonify({"error": "Invalid league"}), 400
+            return _json_response({"error": "Invalid league"}), 400
         
         url = BBC_SCOTTISH_LEAGUES[league]
         
@@ -1070,7 +1669,12 @@ def debug_bbc():
         }
         resp = requests.get(url, headers=headers, timeout=15)
         
-        soup = BeautifulSoup(resp.text, 'html.parser')
+        # lxml parses the ~500KB BBC page in C; fall back to the stdlib
+        # parser when it isn't installed.  Passing bytes skips a decode.
+        try:
+            soup = BeautifulSoup(resp.content, 'lxml')
+        except Exception:
+            soup = BeautifulSoup(resp.text, 'html.parser')
         
         # Find all possible match containers
         debug_info = {
@@ -1081,34 +1685,38 @@ def debug_bbc():
             "potential_matches": {}
         }
         
-        # Try to find elements that might contain matches
-        patterns = [
-            'fixture', 'match', 'event', 'game',
-            'qa-fixture', 'sp-c-fixture',
-            'gel-layout', 'gs-c'
-        ]
-        
-        for pattern in patterns:
-            elements = soup.find_all(class_=lambda x: x and pattern in x.lower())
+        # One filtered DOM walk: the compiled class regex rejects
+        # non-matching elements inside bs4, and only the survivors get
+        # the per-pattern classification
+        matches_by_pattern = {p: [] for p in _BBC_DEBUG_PATTERNS}
+        for el in soup.find_all(class_=_BBC_DEBUG_CLASS_RE):
+            cls_str = " ".join(el.get('class')).lower()
+            for pattern in _BBC_DEBUG_PATTERNS:
+                if pattern in cls_str:
+                    matches_by_pattern[pattern].append(el)
+        for pattern, elements in matches_by_pattern.items():
             if elements:
                 debug_info["potential_matches"][pattern] = {
                     "count": len(elements),
-                    "first_element_classes": elements[0].get('class') if elements else None,
-                    "first_element_html": str(elements[0])[:500] if elements else None
+                    "first_element_classes": elements[0].get('class'),
+                    "first_element_html": str(elements[0])[:500]
                 }
         
-        # Look for any "vs" text
-        vs_texts = soup.find_all(string=lambda text: text and 'v' in text.lower())
-        debug_info["vs_count"] = len([t for t in vs_texts if len(t.strip()) > 5])
+        # Look for any "vs" text; the compiled pattern runs inside bs4
+        # instead of a lambda lowering every string node on the page
+        vs_texts = soup.find_all(string=_BBC_DEBUG_V_RE)
+        debug_info["vs_count"] = sum(1 for t in vs_texts if len(t.strip()) > 5)
         
-        # Sample of the HTML
-        debug_info["html_sample"] = str(soup)[:2000]
+        # Sample of the HTML straight from the response; decoding a slice
+        # of the bytes skips both tree serialization and the encoding
+        # sniff resp.text can run over the whole body
+        debug_info["html_sample"] = resp.content[:2000].decode("utf-8", "replace")
         
-        return jsonify(debug_info)
+        return _json_response(debug_info)
         
     except Exception as e:
         import traceback
-        return jsonify({
+        return _json_response({
             "error": str(e),
             "traceback": traceback.format_exc()
         }), 500
@@ -1289,7 +1897,7 @@ def admin_page():
 @app.route("/api/admin_status")
 def api_admin_status():
     """Return whether the current session is authenticated as admin."""
-    return jsonify({"admin": bool(session.get("admin"))})
+    return _json_response({"admin": bool(session.get("admin"))})
 
 
 @app.route("/api/upcoming_matches")
@@ -1303,24 +1911,12 @@ def api_upcoming_matches():
     parse_events_from_scoreboard.
     """
     # Compute today's date and the date three days ahead in Europe/London
-    tz = pytz.timezone("Europe/London")
-    now = datetime.datetime.now(tz).date()
+    now = datetime.datetime.now(_TZ_LONDON).date()
     end_date = now + datetime.timedelta(days=3)
     start_str = now.strftime("%Y%m%d")
     end_str = end_date.strftime("%Y%m%d")
     date_range_param = f"{start_str}-{end_str}"
-    all_events: List[dict] = []
-    for league in LEAGUE_CODES:
-        scoreboard = fetch_scoreboard(league, date_range_param)
-        if scoreboard:
-            events = parse_events_from_scoreboard(scoreboard, league)
-            all_events.extend(events)
-    # Deduplicate by eventId and sort by title
-    unique_events: Dict[str, dict] = {}
-    for event in all_events:
-        unique_events[event["eventId"]] = event
-    sorted_events = sorted(unique_events.values(), key=lambda e: e["title"])
-    return jsonify(sorted_events)
+    return _json_response(_aggregate_events(date_range_param))
 
 
 # -----------------------------
@@ -1340,15 +1936,15 @@ def api_odds_login():
     password = data.get("password")
     if password and password == ODDS_PASSWORD:
         session["odds"] = True
-        return jsonify({"success": True})
-    return jsonify({"success": False, "error": "Invalid password"}), 401
+        return _json_response({"success": True})
+    return _json_response({"success": False, "error": "Invalid password"}), 401
 
 
 @app.route("/api/odds_logout", methods=["POST"])
 def api_odds_logout():
     """Log out the current odds session."""
     session.pop("odds", None)
-    return jsonify({"success": True})
+    return _json_response({"success": True})
 
 
 @app.route("/api/update_results", methods=["POST"])
@@ -1361,7 +1957,7 @@ def api_update_results():
     when the update completes.
     """
     if not session.get("odds") and not session.get("admin"):
-        return jsonify({"error": "Unauthorized"}), 401
+        return _json_response({"error": "Unauthorized"}), 401
     data = request.get_json(silent=True) or {}
     try:
         days = int(data.get("days", 7))
@@ -1370,7 +1966,7 @@ def api_update_results():
     # Limit the number of days to prevent excessive requests
     days = max(1, min(days, 31))
     update_results(days_back=days)
-    return jsonify({"success": True})
+    return _json_response({"success": True})
 
 
 @app.route("/api/btts_predictions")
@@ -1385,30 +1981,19 @@ def api_btts_predictions():
     order and truncated to the requested limit.
     """
     if not session.get("odds") and not session.get("admin"):
-        return jsonify({"error": "Unauthorized"}), 401
+        return _json_response({"error": "Unauthorized"}), 401
     try:
         limit = int(request.args.get("limit", 5))
     except Exception:
         limit = 5
     limit = max(1, min(limit, 20))
     # Retrieve upcoming matches using existing helper
-    tz = pytz.timezone("Europe/London")
-    now_date = datetime.datetime.now(tz).date()
+    now_date = datetime.datetime.now(_TZ_LONDON).date()
     end_date = now_date + datetime.timedelta(days=3)
     start_str = now_date.strftime("%Y%m%d")
     end_str = end_date.strftime("%Y%m%d")
     date_range_param = f"{start_str}-{end_str}"
-    upcoming: List[dict] = []
-    for lg in LEAGUE_CODES:
-        scoreboard = fetch_scoreboard(lg, date_range_param)
-        if scoreboard:
-            events = parse_events_from_scoreboard(scoreboard, lg)
-            upcoming.extend(events)
-    # Remove duplicates by eventId
-    unique_upcoming: Dict[str, dict] = {}
-    for ev in upcoming:
-        unique_upcoming[ev["eventId"]] = ev
-    upcoming_events = list(unique_upcoming.values())
+    upcoming_events = _aggregate_events(date_range_param)
     # Load historical results
     results = load_results()
     predictions = compute_btts_predictions(results, upcoming_events)
@@ -1417,7 +2002,7 @@ def api_btts_predictions():
     # Round probability to two decimal places for display
     for item in top:
         item["probability"] = round(item["probability"], 2)
-    return jsonify(top)
+    return _json_response(top)
 
 
 @app.route("/odds")
@@ -1443,31 +2028,107 @@ DEFAULT_TELEGRAM = {
 NOTIFY_STATE_FILE = os.path.join(os.path.dirname(__file__), "notify_state.json")
 _notifier_started = False
 
+# The notifier and every send re-derive the Telegram config each call;
+# a 10 s TTL keeps the defaults-merge off the 30 s polling path while
+# still picking up settings edits quickly.
+TG_SETTINGS_TTL = 10
+_tg_settings_cache: tuple = (0.0, None)
+
+
 def tg_settings():
+    global _tg_settings_cache
+    expiry, cfg = _tg_settings_cache
+    if cfg is not None and expiry > time.time():
+        return cfg
     s = load_settings()
     cfg = DEFAULT_TELEGRAM.copy()
     for k in ("telegram_enabled","telegram_bot_token","telegram_chat_id","poll_seconds"):
         if k in s and s[k] not in (None, ""):
             cfg[k] = s[k]
+    _tg_settings_cache = (time.time() + TG_SETTINGS_TTL, cfg)
     return cfg
 
+# Keep-alive session for Telegram: one pooled TLS connection instead of
+# a fresh handshake per message, plus a small pool so the messages from
+# one polling cycle go out concurrently.
+TG_SESSION = requests.Session()
+TG_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=8))
+TG_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Pool for the notifier's per-assignment info fetches; sized so a full
+# friend list resolves in one round trip instead of N.
+NOTIFIER_POOL = ThreadPoolExecutor(max_workers=8)
+
+
+def _tg_post(url: str, payload: dict, timeout: int):
+    """POST a JSON payload to Telegram, serializing with orjson when we can.
+
+    Prebuilding the body skips the stdlib json.dumps requests would run
+    internally for the json= keyword.
+    """
+    if orjson is not None:
+        return TG_SESSION.post(url, data=orjson.dumps(payload),
+                               headers={"Content-Type": "application/json"},
+                               timeout=timeout)
+    return TG_SESSION.post(url, json=payload, timeout=timeout)
+
+
 def tg_send_message(text: str) -> bool:
     cfg = tg_settings()
-    if not cfg.get("telegram_enabled"): 
+    if not cfg.get("telegram_enabled"):
         return False
     token = cfg.get("telegram_bot_token")
     chat_id = cfg.get("telegram_chat_id")
     if not token or not chat_id:
         return False
     try:
-        resp = requests.post(
+        resp = _tg_post(
             f"https://api.telegram.org/bot{token}/sendMessage",
-            json={"chat_id": chat_id, "text": text}
+            {"chat_id": chat_id, "text": text},
+            timeout=5
         )
         return resp.ok
     except Exception:
         return False
 
+
+# Telegram rejects messages longer than this, so batches are chunked
+TG_MESSAGE_LIMIT = 4096
+
+
+def tg_send_messages(texts: List[str]) -> None:
+    """Send a cycle's messages as a few joined posts instead of one each.
+
+    Joining with a separator turns N api.telegram.org round trips into
+    one per 4096-char chunk; multiple chunks still go out concurrently.
+    """
+    if not texts:
+        return
+    if len(texts) == 1:
+        tg_send_message(texts[0])
+        return
+    chunks = []
+    current = ""
+    for text in texts:
+        candidate = f"{current}\n---\n{text}" if current else text
+        if len(candidate) > TG_MESSAGE_LIMIT:
+            if current:
+                chunks.append(current)
+            current = text[:TG_MESSAGE_LIMIT]
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    if len(chunks) == 1:
+        tg_send_message(chunks[0])
+        return
+    futures = [TG_POOL.submit(tg_send_message, chunk) for chunk in chunks]
+    for future in futures:
+        try:
+            future.result()
+        except Exception:
+            pass
+
 def load_notify_state():
     try:
         with open(NOTIFY_STATE_FILE, "r") as f:
@@ -1477,8 +2138,9 @@ def load_notify_state():
 
 def save_notify_state(state):
     try:
-        with open(NOTIFY_STATE_FILE, "w") as f:
-            json.dump(state, f)
+        # Write-behind: the notifier rewrites this every cycle and must
+        # not stall on disk
+        _enqueue_json_write(NOTIFY_STATE_FILE, dict(state))
     except Exception:
         pass
 
@@ -1497,12 +2159,13 @@ def get_match_info_for_event(event_id: str):
             data = summary
             league = lg
             event_league_map[event_id] = lg
+            _persist_event_league_map()
             break
     if not data:
         for lg in LEAGUE_CODES:
             summary = fetch_match_summary(event_id, lg)
             if summary:
-                data = summary; event_league_map[event_id] = lg; league = lg; break
+                data = summary; event_league_map[event_id] = lg; league = lg; _persist_event_league_map(); break
     if not data: return None
 
     header = data.get("header", {})
@@ -1513,35 +2176,30 @@ def get_match_info_for_event(event_id: str):
     status_detail = comp.get("status", {}).get("type", {}).get("shortDetail") or comp.get("status", {}).get("type", {}).get("detail") or ""
     competitors = comp.get("competitors", [])
     home_team = away_team = ""
+    home_id = away_id = ""
     home_score = away_score = 0
     for c in competitors:
         if c.get("homeAway") == "home":
             home_team = c.get("team", {}).get("name", "")
-            try: home_score = int(c.get("score", 0))
-            except: home_score = 0
+            home_id = str(c.get("team", {}).get("id", ""))
+            home_score = _score(c)
         elif c.get("homeAway") == "away":
             away_team = c.get("team", {}).get("name", "")
-            try: away_score = int(c.get("score", 0))
-            except: away_score = 0
+            away_id = str(c.get("team", {}).get("id", ""))
+            away_score = _score(c)
     event_date_str = comp.get("date") or header.get("competitions", [{}])[0].get("date")
     kickoff_time = ""
     try:
-        dt_utc = datetime.datetime.fromisoformat(event_date_str.replace("Z", "+00:00"))
-        tz_london = pytz.timezone("Europe/London")
-        dt_local = dt_utc.astimezone(tz_london)
-        kickoff_time = dt_local.strftime("%H:%M")
+        dt_utc = _parse_iso_utc(event_date_str)
+        dt_local = dt_utc.astimezone(_TZ_LONDON)
+        kickoff_time = f"{dt_local.hour:02d}:{dt_local.minute:02d}"
         if state == "pre":
-            kickoff_time = dt_local.strftime("%A %H:%M")
+            kickoff_time = f"{_WEEKDAYS[dt_local.weekday()]} {kickoff_time}"
     except Exception:
         kickoff_time = ""
     btts = home_score > 0 and away_score > 0
-    try:
-        home_id = str(home_comp.get("team", {}).get("id", ""))
-        away_id = str(away_comp.get("team", {}).get("id", ""))
-    except Exception:
-        home_id = ""
-        away_id = ""
-    home_red, away_red = _count_red_cards_from_summary(data, home_id, away_id)
+    home_red, away_red = _red_cards_cached(event_id, data, home_id, away_id,
+                                           home_score, away_score, status_detail)
     return {
         "eventId": event_id,
         "league": league,
@@ -1553,45 +2211,71 @@ def get_match_info_for_event(event_id: str):
     }
 
 
+# Parses ids like bbc_sco.4_Stirling_Albion_Elgin_City into league,
+# underscore-joined home names and the away name.
+_BBC_EVENT_ID_RE = re.compile(r"^bbc_([^_]+)_(.+)_([^_]+)$")
+
+# One BBC scrape per league per polling window.  Several friends often
+# track fixtures from the same league page, so the page is fetched once
+# and indexed by lowercased (home, away) pair.
+BBC_LEAGUE_CACHE_TTL = 60
+_bbc_league_cache: Dict[str, tuple] = {}
+
+
+def get_bbc_scores_for_league(league: str) -> Dict[tuple, dict]:
+    """Scrape a BBC league page once and index its fixtures by team pair."""
+    cached = _bbc_league_cache.get(league)
+    if cached is not None and cached[0] > time.time():
+        return cached[1]
+    index: Dict[tuple, dict] = {}
+    try:
+        from bbc_scraper import scrape_bbc_fixtures
+        for fixture in scrape_bbc_fixtures(league):
+            key = (fixture.get("home_team", "").lower(),
+                   fixture.get("away_team", "").lower())
+            index[key] = fixture
+    except Exception as e:
+        print(f"BBC scraper error for league {league}: {e}")
+    _bbc_league_cache[league] = (time.time() + BBC_LEAGUE_CACHE_TTL, index)
+    return index
+
+
 def get_match_info_from_bbc(event_id: str):
     """Get live match info from BBC scraper for manual/BBC matches."""
     try:
-        from bbc_scraper import get_bbc_live_score
-        
-        # Get match details from manual matches or parse from event_id
-        manual_matches = load_manual_matches()
-        match_info = None
-        
-        # Find the match in manual matches
-        for match in manual_matches:
-            if match.get("eventId") == event_id:
-                match_info = match
-                break
-        
+        # Manual matches are indexed by eventId; load_manual_matches
+        # refreshes the index only when the file has changed
+        load_manual_matches()
+        match_info = _manual_matches_by_id.get(event_id)
+
         if not match_info and event_id.startswith("bbc_"):
-            # Parse event ID: bbc_sco.4_Stirling_Albion_Elgin_City
-            parts = event_id.split("_")
-            if len(parts) >= 3:
-                league = parts[1]
-                # Reconstruct team names
-                home_team = " ".join(parts[2:-1])  # Everything between league and last part
-                away_team = parts[-1].replace("_", " ")
+            m = _BBC_EVENT_ID_RE.match(event_id)
+            if m:
+                league, home_part, away_team = m.groups()
                 match_info = {
-                    "homeTeam": home_team,
+                    "homeTeam": home_part.replace("_", " "),
                     "awayTeam": away_team,
                     "league": league
                 }
-        
+
         if not match_info:
             return None
-        
-        # Scrape BBC for live score
-        bbc_data = get_bbc_live_score(
-            match_info.get("homeTeam", ""),
-            match_info.get("awayTeam", ""),
-            match_info.get("league", "")
-        )
-        
+
+        # Look the fixture up in the once-per-league scrape
+        fixtures = get_bbc_scores_for_league(match_info.get("league", ""))
+        home_norm = match_info.get("homeTeam", "").lower()
+        away_norm = match_info.get("awayTeam", "").lower()
+        bbc_data = fixtures.get((home_norm, away_norm))
+
+        if not bbc_data and home_norm and away_norm:
+            # Exact key missed - fall back to a substring scan so minor
+            # naming differences ("Spartans" vs "The Spartans") still hit
+            for (fix_home, fix_away), fixture in fixtures.items():
+                if ((home_norm in fix_home or fix_home in home_norm)
+                        and (away_norm in fix_away or fix_away in away_norm)):
+                    bbc_data = fixture
+                    break
+
         if not bbc_data:
             # Return match info without scores
             return {
@@ -1609,34 +2293,23 @@ def get_match_info_from_bbc(event_id: str):
                 "btts": False
             }
         
-        # Map BBC status to ESPN-style state
-        status = bbc_data.get("status", "Scheduled")
-        if status == "FT":
-            state = "post"
-        elif status in ["HT", "In Progress"] or any(c.isdigit() for c in status):
-            state = "in"
-        else:
-            state = "pre"
-        
-        home_score = bbc_data.get("homeScore", 0)
-        away_score = bbc_data.get("awayScore", 0)
-        btts = home_score > 0 and away_score > 0
-        
+        # The fixtures page carries kickoff times but no live scores, so
+        # BBC-backed matches surface as scheduled
         return {
             "eventId": event_id,
-            "league": bbc_data.get("league", ""),
-            "homeTeam": bbc_data.get("homeTeam", ""),
-            "awayTeam": bbc_data.get("awayTeam", ""),
-            "homeScore": home_score,
-            "awayScore": away_score,
+            "league": bbc_data.get("league_code", match_info.get("league", "")),
+            "homeTeam": bbc_data.get("home_team", ""),
+            "awayTeam": bbc_data.get("away_team", ""),
+            "homeScore": 0,
+            "awayScore": 0,
             "homeRedCards": 0,  # BBC doesn't show red cards easily
             "awayRedCards": 0,
-            "status": status,
-            "state": state,
-            "kickoffTime": "",
-            "btts": btts
+            "status": bbc_data.get("kickoff_time") or match_info.get("status", "Scheduled"),
+            "state": "pre",
+            "kickoffTime": bbc_data.get("kickoff_time", ""),
+            "btts": False
         }
-        
+
     except Exception as e:
         print(f"BBC scraper error for {event_id}: {e}")
         return None
@@ -1654,9 +2327,19 @@ def notifier_loop():
                 time.sleep(cfg.get("poll_seconds",30)); 
                 continue
             assignments = load_assignments()
-            for friend, event_id in assignments.items():
-                if not event_id: continue
-                info = get_match_info_for_event(event_id)
+            assigned = [(friend, event_id) for friend, event_id in assignments.items() if event_id]
+            # Fetch each distinct event once, in parallel; friends often
+            # share an event and each serial call blocks on ESPN/BBC
+            unique_ids = {event_id for _, event_id in assigned}
+            info_futures = {eid: NOTIFIER_POOL.submit(get_match_info_for_event, eid)
+                            for eid in unique_ids}
+            infos = {eid: future.result() for eid, future in info_futures.items()}
+            # Collect this cycle's messages and flush them concurrently
+            # at the end instead of blocking on Telegram per event
+            pending_msgs: List[str] = []
+            dirty = False
+            for friend, event_id in assigned:
+                info = infos.get(event_id)
                 if not info: continue
                 key = event_id
                 prev = state.get(key, {"state": "", "homeScore": 0, "awayScore": 0, "kickoffSent": False, "bttsSent": False, "ftSent": False})
@@ -1664,39 +2347,58 @@ def notifier_loop():
                 hs, as_ = info["homeScore"], info["awayScore"]
                 minute = format_minute(info.get("status",""))
                 if cur_state == "in" and not prev.get("kickoffSent"):
-                    tg_send_message(f"Kickoff {friend}: {info['homeTeam']} vs {info['awayTeam']} ({info['kickoffTime']})")
+                    pending_msgs.append(f"Kickoff {friend}: {info['homeTeam']} vs {info['awayTeam']} ({info['kickoffTime']})")
                     prev["kickoffSent"] = True
                 if (hs != prev.get("homeScore") or as_ != prev.get("awayScore")) and cur_state == "in":
-                    tg_send_message(f"Goal for {friend}: {info['homeTeam']} {hs} {info['awayTeam']} {as_} - {minute}")
+                    pending_msgs.append(f"Goal for {friend}: {info['homeTeam']} {hs} {info['awayTeam']} {as_} - {minute}")
                 if info["btts"] and not prev.get("bttsSent"):
-                    tg_send_message(f"BTTS {friend}: Both teams have scored - {info['homeTeam']} {hs} {info['awayTeam']} {as_} ({minute})")
+                    pending_msgs.append(f"BTTS {friend}: Both teams have scored - {info['homeTeam']} {hs} {info['awayTeam']} {as_} ({minute})")
                     prev["bttsSent"] = True
                 if cur_state == "post" and not prev.get("ftSent"):
-                    tg_send_message(f"FT {friend}: {info['homeTeam']} {hs} {info['awayTeam']} {as_}")
+                    pending_msgs.append(f"FT {friend}: {info['homeTeam']} {hs} {info['awayTeam']} {as_}")
                     prev["ftSent"] = True
+                if (key not in state or prev["state"] != cur_state
+                        or prev["homeScore"] != hs or prev["awayScore"] != as_):
+                    dirty = True
                 prev["state"] = cur_state
                 prev["homeScore"] = hs
                 prev["awayScore"] = as_
                 state[key] = prev
-            save_notify_state(state)
+            tg_send_messages(pending_msgs)
+            # Sent flags only flip alongside a message, so pending_msgs
+            # covers them; quiet cycles skip the state write entirely
+            if dirty or pending_msgs:
+                save_notify_state(state)
         except Exception:
             pass
         time.sleep(cfg.get("poll_seconds", 30))
 
+_NOTIFIER_LOCK_FILE = "/tmp/btts_notifier.lock"
+_notifier_lock_handle = None
+
 def start_notifier_once():
-    global _notifier_started
+    """Start the background notifier thread in exactly one process.
+
+    Multi-worker servers (e.g. gunicorn) import the app once per worker;
+    an exclusive non-blocking flock on a /tmp file makes sure only the
+    first worker runs the loop. The lock is held for the life of the
+    process and released by the OS on exit.
+    """
+    global _notifier_started, _notifier_lock_handle
     if _notifier_started: return
     if os.environ.get("WERKZEUG_RUN_MAIN") == "true" or not app.debug:
+        if fcntl is not None:
+            try:
+                handle = open(_NOTIFIER_LOCK_FILE, "w")
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                # Another worker already owns the notifier
+                return
+            _notifier_lock_handle = handle
         t = threading.Thread(target=notifier_loop, daemon=True)
         t.start()
         _notifier_started = True
 
-start_notifier_once()
-if __name__ == "__main__":
-    # When running directly, enable debug mode for easier development.
-    # Listen on port 8094 instead of the previous default of 8000.
-    app.run(host="0.0.0.0", port=8094, debug=True)
-
 @app.route("/notify")
 def notify_page():
     return render_template("notify.html", app_version=APP_VERSION)
@@ -1708,7 +2410,7 @@ def update_telegram():
     token = (data.get("token") or data.get("telegram_bot_token") or "").strip()
     chat_id = (data.get("chat_id") or data.get("telegram_chat_id") or "").strip()
     if not token or not chat_id:
-        return jsonify({"success": False, "message": "Missing token or chat ID."}), 400
+        return _json_response({"success": False, "message": "Missing token or chat ID."}), 400
     try:
         # Load existing settings to preserve other keys
         settings = load_settings()
@@ -1720,8 +2422,8 @@ def update_telegram():
             settings["poll_seconds"] = DEFAULT_TELEGRAM.get("poll_seconds", 30)
         save_settings(settings)
     except Exception as ex:
-        return jsonify({"success": False, "message": f"Error saving settings: {ex}"}), 500
-    return jsonify({"success": True, "message": "Telegram settings saved successfully."})
+        return _json_response({"success": False, "message": f"Error saving settings: {ex}"}), 500
+    return _json_response({"success": True, "message": "Telegram settings saved successfully."})
 
 
 @app.route("/test_telegram", methods=["POST"])
@@ -1737,12 +2439,12 @@ def test_telegram():
             token = token or t2
             chat_id = chat_id or c2
         if not token or not chat_id:
-            return jsonify({"success": False, "message": "Missing token or chat_id. Save them first on the Notify page."}), 400
+            return _json_response({"success": False, "message": "Missing token or chat_id. Save them first on the Notify page."}), 400
         data = request.get_json(silent=True) or {}
         text = (data.get("text") or "BTTS Test Notification ✅").strip()
         url = f"https://api.telegram.org/bot{token}/sendMessage"
         payload = {"chat_id": chat_id, "text": text, "parse_mode": "HTML"}
-        r = requests.post(url, json=payload, timeout=10)
+        r = _tg_post(url, payload, timeout=10)
         ok = False
         msg = f"HTTP {r.status_code}"
         try:
@@ -1753,13 +2455,13 @@ def test_telegram():
         except Exception:
             pass
         if ok:
-            return jsonify({"success": True, "message": "Test message sent."})
-        return jsonify({"success": False, "message": f"Failed to send. {msg}"}), 502
+            return _json_response({"success": True, "message": "Test message sent."})
+        return _json_response({"success": False, "message": f"Failed to send. {msg}"}), 502
     except Exception as ex:
-        return jsonify({"success": False, "message": f"Error: {ex}"}), 500
-        return jsonify({"success": False, "message": f"Failed to send. {msg}"}), 502
+        return _json_response({"success": False, "message": f"Error: {ex}"}), 500
+        return _json_response({"success": False, "message": f"Failed to send. {msg}"}), 502
     except Exception as ex:
-        return jsonify({"success": False, "message": f"Error: {ex}"}), 500
+        return _json_response({"success": False, "message": f"Error: {ex}"}), 500
 
 
 def _load_saved_telegram():
@@ -1774,8 +2476,8 @@ def _load_saved_telegram():
     and 'telegram_chat_id' if present.
     """
     try:
-        with open(SETTINGS_FILE, "r") as f:
-            s = json.load(f)
+        # The mtime-keyed file cache makes repeat reads a stat call
+        s = _load_json_file(SETTINGS_FILE)
         if not isinstance(s, dict):
             return ("", "")
         token = s.get("telegram_bot_token") or s.get("telegram_token") or ""
@@ -1798,7 +2500,7 @@ def telegram_status():
             if not t: return ""
             if len(t) <= 6: return "*"*len(t)
             return t[:6] + "..." + t[-4:]
-        return jsonify({
+        return _json_response({
             "env_or_runtime_token_present": bool(token),
             "env_or_runtime_chat_present": bool(chat_id),
             "saved_token_present": bool(t2),
@@ -1807,4 +2509,14 @@ def telegram_status():
             "effective_chat_id": chat_eff
         })
     except Exception as ex:
-        return jsonify({"success": False, "message": f"Error: {ex}"}), 500
+        return _json_response({"success": False, "message": f"Error: {ex}"}), 500
+
+
+# Start the notifier after every route and helper above is defined, so
+# the thread (and any worker that imports this module) sees the full app.
+start_notifier_once()
+
+if __name__ == "__main__":
+    # When running directly, enable debug mode for easier development.
+    # Listen on port 8094 instead of the previous default of 8000.
+    app.run(host="0.0.0.0", port=8094, debug=True)
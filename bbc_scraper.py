@@ -3,10 +3,132 @@ BBC Sport scraper for Scottish football fixtures.
 Enhanced version with comprehensive debugging capabilities.
 """
 
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 
+# aiohttp lets the four league pages download concurrently instead of
+# serially; the session-based path is the fallback.
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# lxml parses BBC's multi-thousand-element pages several times faster
+# than the pure-Python html.parser; fall back when it isn't installed.
+# lxml.html also powers an XPath fast path that skips bs4 entirely.
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    LXML_AVAILABLE = False
+    _SOUP_PARSER = 'html.parser'
+
+# Only advertise brotli when requests can actually decode it; BBC's br
+# responses are ~20% smaller than gzip.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    _ACCEPT_ENCODING = 'gzip, deflate'
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled keep-alive session for every BBC fetch.  All four league
+# pages live on the same host, so reusing the connection saves a TCP+TLS
+# handshake on each scrape after the first.  When requests-cache is
+# installed the session also persists responses to SQLite, so a freshly
+# restarted process serves cached pages instead of refetching; kept
+# optional and short-lived (5 min) so fixtures stay current.
+try:
+    import requests_cache
+    _SESSION = requests_cache.CachedSession(
+        'bbc_cache', backend='sqlite', expire_after=300,
+        allowable_methods=['GET'], stale_if_error=True,
+    )
+except ImportError:
+    _SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    # Matching BBC's UK variant up front avoids a locale redirect
+    'Accept-Language': 'en-GB',
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
+# Split connect/read timeout: fail fast when BBC is unreachable without
+# cutting short a slow page transfer.
+_TIMEOUT = (3.05, 10)
+
+
+# Parsed fixtures per league, kept for a few seconds so bursts of
+# lookups (one per tracked team) reuse one fetch + parse.  The TTL sits
+# below the app's poll interval so each poll still sees fresh pages.
+_FIXTURE_CACHE = {}
+_FIXTURE_CACHE_TTL = 15.0
+# The scraper is called from request handlers, the notifier thread and
+# the all-leagues pool at once; the lock keeps lookups and stores paired
+_FIXTURE_CACHE_LOCK = threading.Lock()
+
+# One C-level scan per team name instead of a per-character generator
+_HAS_DIGIT = re.compile(r'\d').search
+
+# "Home v Away" in one match: the digit-free classes also reject score
+# strings, so one C call replaces split + two digit scans
+_FIXTURE_RE = re.compile(r'^([^\d]{3,40}) v ([^\d]{3,40})$')
+
+# Last-resort "Team A v Team B" scan over the page text for layouts
+# where the fixtures aren't anchor links
+_TEAMS_V_RE = re.compile(r"([A-Z][A-Za-z' ]{2,30})\s+v\s+([A-Z][A-Za-z' ]{2,30})")
+
+# The embedded-JSON script tag, compiled once rather than per page
+_NEXT_DATA_RE = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+
+# Field names probed on embedded-JSON nodes, in preference order
+_JSON_NAME_KEYS = ('fullName', 'longName', 'name', 'shortName')
+_JSON_TIME_KEYS = ('startTimeInUKHHMM', 'kickOffTime', 'time', 'startDateTime', 'date')
+# Keys whose values carry a full ISO timestamp rather than display text
+_JSON_ISO_KEYS = ('startDateTime', 'date')
+
+# Last validators (ETag, Last-Modified) and parsed fixtures per league,
+# for conditional GETs.  When BBC answers 304 the cached parse is reused
+# and no body is transferred; unlike _FIXTURE_CACHE these entries never
+# expire, the revalidation request itself decides freshness.
+_VALIDATORS = {}
+
+# Candidate fixture anchors selected entirely inside libxml2: both the
+# href and the " v " text predicates run in C before Python sees a node
+_FIXTURE_ANCHOR_XPATH = (
+    lxml.etree.XPath('//a[contains(@href, "/football/") and contains(., " v ")]')
+    if LXML_AVAILABLE else None
+)
+
+# First <time> beneath a node, compiled once; applied to each of a
+# fixture anchor's nearest ancestors in turn so the closest one wins
+_TIME_XPATH = (
+    lxml.etree.XPath('(.//time)[1]')
+    if LXML_AVAILABLE else None
+)
+
+
+log = logging.getLogger(__name__)
+
 
 # Map ESPN league codes to BBC URLs
 BBC_SCOTTISH_LEAGUES = {
@@ -27,13 +149,11 @@ def scrape_bbc_fixtures_debug(league_code):
         return {"error": "Invalid league code", "fixtures": [], "debug": {}}
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, timeout=_TIMEOUT)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Bytes in, so the parser handles the encoding itself
+        soup = BeautifulSoup(response.content, _SOUP_PARSER)
         
         # Debug info
         debug_info = {
@@ -88,8 +208,8 @@ def scrape_bbc_fixtures_debug(league_code):
                         away_team = teams[1].strip()
                         
                         if len(home_team) >= 3 and len(away_team) >= 3:
-                            if not any(char.isdigit() for char in home_team) and not any(char.isdigit() for char in away_team):
-                                fixture_key = f"{home_team}|{away_team}"
+                            if not _HAS_DIGIT(home_team) and not _HAS_DIGIT(away_team):
+                                fixture_key = (home_team, away_team)
                                 if fixture_key not in seen_fixtures:
                                     seen_fixtures.add(fixture_key)
                                     
@@ -129,25 +249,346 @@ def scrape_bbc_fixtures_debug(league_code):
         }
 
 
+def _team_name(side):
+    """Pull a display name out of one side of an embedded-JSON fixture."""
+    if not isinstance(side, dict):
+        return ""
+    inner = side.get('team') if isinstance(side.get('team'), dict) else side
+    for key in _JSON_NAME_KEYS:
+        val = inner.get(key)
+        if isinstance(val, str) and val:
+            return val.strip()
+    return ""
+
+
+def _fixtures_from_next_data(content, league_code):
+    """
+    Extract fixtures from the JSON blob BBC embeds in __NEXT_DATA__.
+
+    The page ships its full dataset as JSON in a script tag, so when
+    it's there we can read structured team/kickoff fields directly and
+    skip building an HTML tree entirely.  Returns None when the blob is
+    missing or yields nothing, so callers fall back to the HTML walk.
+    """
+    m = _NEXT_DATA_RE.search(content)
+    if not m:
+        return None
+    try:
+        data = json.loads(m.group(1))
+    except Exception:
+        return None
+    fixtures = []
+    seen = set()
+    # BBC nests the fixtures list at a path that shifts between page
+    # builds, so walk the tree for home/away pairs instead of hardcoding it
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            home_team = _team_name(node.get('home'))
+            away_team = _team_name(node.get('away'))
+            if home_team and away_team:
+                key = (home_team, away_team)
+                if key not in seen:
+                    seen.add(key)
+                    kickoff_time = "TBD"
+                    for tkey in _JSON_TIME_KEYS:
+                        val = node.get(tkey)
+                        if isinstance(val, str) and val:
+                            kickoff_time = val
+                            break
+                    kickoff_iso = ""
+                    for tkey in _JSON_ISO_KEYS:
+                        val = node.get(tkey)
+                        if isinstance(val, str) and 'T' in val:
+                            kickoff_iso = val
+                            break
+                    fixtures.append({
+                        'home_team': home_team,
+                        'away_team': away_team,
+                        'kickoff_time': kickoff_time,
+                        'kickoff_iso': kickoff_iso,
+                        'league_code': league_code
+                    })
+                continue
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return fixtures or None
+
+
+def _parse_fixtures(content, league_code):
+    """
+    Extract the fixtures list from a fetched BBC page.
+
+    Tries the embedded __NEXT_DATA__ JSON first, then an lxml XPath
+    walk, then the bs4 anchor scan - same matching rules as
+    scrape_bbc_fixtures_debug but without the debug bookkeeping.
+    """
+    fixtures = _fixtures_from_next_data(content, league_code)
+    if fixtures is not None:
+        return fixtures
+    if LXML_AVAILABLE:
+        try:
+            fixtures = _parse_fixtures_lxml(content, league_code)
+            if fixtures:
+                return fixtures
+            # An empty result means the anchor layout changed; drop to the
+            # soup path, which carries the whole-page text-scan fallback
+        except Exception as e:
+            log.warning("lxml fixture parse failed for %s: %s", league_code, e)
+    return _parse_fixtures_soup(content, league_code)
+
+
+def _extract_fixture_lxml(link, league_code, seen_fixtures):
+    """Turn one candidate anchor into a fixture dict, or None to skip it."""
+    # .text is just the anchor's own first text node; only fall back
+    # to the recursive text_content walk when the fixture text is
+    # spread across nested spans
+    text = link.text
+    if not text or ' v ' not in text:
+        text = link.text_content()
+    m = _FIXTURE_RE.match(text.strip())
+    if not m:
+        return None
+    home_team = m.group(1).strip()
+    away_team = m.group(2).strip()
+    if len(home_team) < 3 or len(away_team) < 3:
+        return None
+    fixture_key = (home_team, away_team)
+    if fixture_key in seen_fixtures:
+        return None
+    seen_fixtures.add(fixture_key)
+
+    kickoff_time = "TBD"
+    kickoff_iso = ""
+    # Walk the three nearest parents and take the first <time> under the
+    # closest one, like the soup path.  A single ancestor-axis query
+    # returns document order, which grabs a sibling fixture's time once
+    # two fixtures share a container.
+    node = link.getparent()
+    for _ in range(3):
+        if node is None:
+            break
+        time_elems = _TIME_XPATH(node)
+        if time_elems:
+            time_elem = time_elems[0]
+            kickoff_time = time_elem.text_content().strip() or "TBD"
+            # The canonical ISO timestamp, when the page provides it, so
+            # consumers can sort/compare without reparsing display text
+            kickoff_iso = time_elem.get('datetime') or ""
+            break
+        node = node.getparent()
+
+    return {
+        'home_team': home_team,
+        'away_team': away_team,
+        'kickoff_time': kickoff_time,
+        'kickoff_iso': kickoff_iso,
+        'league_code': league_code
+    }
+
+
+def _parse_fixtures_lxml(content, league_code):
+    """XPath-based fixture extraction; one compiled query finds anchors."""
+    tree = lxml.html.fromstring(content)
+    seen_fixtures = set()
+    return [fixture for fixture in
+            (_extract_fixture_lxml(link, league_code, seen_fixtures)
+             for link in _FIXTURE_ANCHOR_XPATH(tree))
+            if fixture is not None]
+
+
+def _parse_fixtures_soup(content, league_code):
+    """bs4 fallback for the fixture extraction when lxml is unavailable."""
+    soup = BeautifulSoup(content, _SOUP_PARSER)
+    fixtures = []
+    seen_fixtures = set()
+    for link in soup.find_all('a', href=True):
+        # Cheapest tests first: the href check is a plain attribute
+        # lookup, get_text walks the subtree
+        if '/football/' not in link['href']:
+            continue
+        m = _FIXTURE_RE.match(link.get_text(strip=True))
+        if not m:
+            continue
+        home_team = m.group(1).strip()
+        away_team = m.group(2).strip()
+        if len(home_team) < 3 or len(away_team) < 3:
+            continue
+        fixture_key = (home_team, away_team)
+        if fixture_key in seen_fixtures:
+            continue
+        seen_fixtures.add(fixture_key)
+
+        kickoff_time = "TBD"
+        kickoff_iso = ""
+        parent = link.parent
+        for _ in range(3):
+            if parent:
+                time_elem = parent.find('time')
+                if time_elem:
+                    kickoff_time = time_elem.get_text(strip=True)
+                    kickoff_iso = time_elem.get('datetime') or ""
+                    break
+                parent = parent.parent
+
+        fixtures.append({
+            'home_team': home_team,
+            'away_team': away_team,
+            'kickoff_time': kickoff_time,
+            'kickoff_iso': kickoff_iso,
+            'league_code': league_code
+        })
+    if not fixtures:
+        # No fixture anchors at all - fall back to one linear regex
+        # scan of the page text rather than walking every tag
+        page_text = soup.get_text(separator=' ', strip=True)
+        for m in _TEAMS_V_RE.finditer(page_text):
+            home_team = m.group(1).strip()
+            away_team = m.group(2).strip()
+            fixture_key = (home_team, away_team)
+            if fixture_key in seen_fixtures:
+                continue
+            seen_fixtures.add(fixture_key)
+            fixtures.append({
+                'home_team': home_team,
+                'away_team': away_team,
+                'kickoff_time': 'TBD',
+                'league_code': league_code
+            })
+    # The tree holds thousands of cross-referencing nodes; break it up
+    # now rather than waiting on the cycle collector
+    soup.decompose()
+    return fixtures
+
+
+def _scrape_league(url, league_code):
+    """Fetch and parse one league page; url is pre-bound per league."""
+    now = time.monotonic()
+    with _FIXTURE_CACHE_LOCK:
+        hit = _FIXTURE_CACHE.get(league_code)
+        if hit and now - hit[0] < _FIXTURE_CACHE_TTL:
+            return hit[1]
+    try:
+        headers = {}
+        known = _VALIDATORS.get(league_code)
+        if known:
+            if known[0]:
+                headers['If-None-Match'] = known[0]
+            if known[1]:
+                headers['If-Modified-Since'] = known[1]
+        response = _SESSION.get(url, headers=headers, timeout=_TIMEOUT)
+        if response.status_code == 304 and known:
+            fixtures = known[2]
+        else:
+            response.raise_for_status()
+            fixtures = _parse_fixtures(response.content, league_code)
+            etag = response.headers.get('ETag', '')
+            last_modified = response.headers.get('Last-Modified', '')
+            if etag or last_modified:
+                _VALIDATORS[league_code] = (etag, last_modified, fixtures)
+    except Exception as e:
+        log.warning("BBC scraper error for %s: %s", league_code, e)
+        return []
+
+    with _FIXTURE_CACHE_LOCK:
+        _FIXTURE_CACHE[league_code] = (now, fixtures)
+    log.info("BBC scraper: found %d fixtures for %s", len(fixtures), league_code)
+    return fixtures
+
+
+# One specialized scraper per league with its URL pre-bound, so the
+# per-call dispatch is a single dict lookup
+_SCRAPERS = {code: partial(_scrape_league, url, code)
+             for code, url in BBC_SCOTTISH_LEAGUES.items()}
+
+
 def scrape_bbc_fixtures(league_code):
     """
     Main scraper function - returns just fixtures list.
     Uses robust text pattern matching to find fixtures on BBC Sport pages.
-    
+
     Args:
         league_code: ESPN league code (e.g., 'sco.4' for Scottish League Two)
-    
+
     Returns:
         List of fixture dictionaries with home_team, away_team, kickoff_time
     """
-    result = scrape_bbc_fixtures_debug(league_code)
-    fixtures = result.get("fixtures", [])
-    
-    print(f"BBC Scraper: Found {len(fixtures)} fixtures for {league_code}")
-    if result.get("error"):
-        print(f"BBC Scraper Error: {result['error']}")
-    
-    return fixtures
+    scraper = _SCRAPERS.get(league_code)
+    if scraper is None:
+        return []
+    return scraper()
+
+
+async def _fetch_page(session, url):
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+        resp.raise_for_status()
+        return await resp.read()
+
+
+async def _scrape_all_async(codes):
+    headers = dict(_SESSION.headers)
+    connector = aiohttp.TCPConnector(limit_per_host=8)
+    async with aiohttp.ClientSession(headers=headers, connector=connector) as session:
+        tasks = [_fetch_page(session, BBC_SCOTTISH_LEAGUES[code]) for code in codes]
+        pages = await asyncio.gather(*tasks, return_exceptions=True)
+    results = {}
+    for code, page in zip(codes, pages):
+        if isinstance(page, Exception):
+            log.warning("BBC scraper error for %s: %s", code, page)
+            results[code] = []
+        else:
+            results[code] = _parse_fixtures(page, code)
+    return results
+
+
+def scrape_bbc_fixtures_all(codes):
+    """
+    Fetch several leagues' fixtures concurrently over the shared session.
+
+    Threads overlap the socket waits (requests releases the GIL there)
+    and the session adapter's pool carries the parallel fetches; going
+    through scrape_bbc_fixtures keeps the per-league cache populated.
+    """
+    if len(codes) == 1:
+        return {codes[0]: scrape_bbc_fixtures(codes[0])}
+    with ThreadPoolExecutor(max_workers=len(codes)) as pool:
+        return dict(zip(codes, pool.map(scrape_bbc_fixtures, codes)))
+
+
+def scrape_all_scottish_fixtures(codes=None):
+    """
+    Scrape every Scottish league page in one go.
+
+    With aiohttp installed the four pages download concurrently (one
+    round trip instead of four); otherwise the threaded fetch does the
+    same over the pooled session.  Returns a dict mapping
+    league_code -> fixtures list.
+    """
+    if codes is None:
+        codes = list(BBC_SCOTTISH_LEAGUES)
+    now = time.monotonic()
+    results = {}
+    misses = []
+    with _FIXTURE_CACHE_LOCK:
+        for code in codes:
+            hit = _FIXTURE_CACHE.get(code)
+            if hit and now - hit[0] < _FIXTURE_CACHE_TTL:
+                results[code] = hit[1]
+            else:
+                misses.append(code)
+    if not misses:
+        return results
+    if AIOHTTP_AVAILABLE:
+        fetched = asyncio.run(_scrape_all_async(misses))
+        with _FIXTURE_CACHE_LOCK:
+            for code, fixtures in fetched.items():
+                _FIXTURE_CACHE[code] = (now, fixtures)
+        results.update(fetched)
+    else:
+        results.update(scrape_bbc_fixtures_all(misses))
+    return results
 
 
 if __name__ == "__main__":